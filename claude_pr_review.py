@@ -1,21 +1,32 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import json
+import hashlib
 import time
 import subprocess
 import tempfile
+import shlex
 import shutil
+import uuid
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import signal
+import sqlite3
+import stat
 import sys
+import threading
 
 # Configuration
 CONFIG = {
-    "repo_path": "/Users/scott/Projects/equity-etl/ky-education-kpi-pipeline",  # Your repo path
+    "repo_path": "/Users/scott/Projects/equity-etl/ky-education-kpi-pipeline",  # Working directory for diff-only reviews
     "data_path": "/Users/scott/Projects/equity-etl/ky-education-kpi-pipeline/data",  # Path to data directory
     "github_token": os.environ.get("GITHUB_TOKEN", "your_token_here"),
     "repo_owner": "jscotthorn",
@@ -23,12 +34,86 @@ CONFIG = {
     "check_interval": 300,  # seconds
     "base_branch": "develop",  # Changed from "main" to "develop"
     "required_label": "codex",  # Only process PRs with this label
+    "run_label": "codex-run",  # PRs with this label are checked out so Claude can run pipelines/tests
+    "sparse_checkout_dirs": ["config", "etl", "tests"],  # Always checked out alongside the PR's own directories
     "max_prs_to_review": None,  # Set to a number to limit reviews (e.g., 5), None for unlimited
+    "review_workers": 4,  # PRs reviewed concurrently, each in its own clone
     "claude_path": "/Users/scott/.claude/local/claude",  # Full path to claude executable
+    "claude_timeout": 1800,  # Seconds before a Claude CLI review is abandoned
+    "review_backend": "cli",  # "cli" runs the Claude CLI in the clone; "api" calls the Messages API
+    "anthropic_model": "claude-sonnet-4-20250514",  # Model used by the "api" backend
+    "anthropic_max_tokens": 4096,
     "review_dir": Path.home() / ".pr_reviewer",
-    "processed_prs_file": Path.home() / ".pr_reviewer" / "processed_prs.json"
+    "processed_prs_file": Path.home() / ".pr_reviewer" / "processed_prs.json",  # Legacy store, imported once
+    "processed_db": Path.home() / ".pr_reviewer" / "processed.db"
 }
 
+GRAPHQL_URL = "https://api.github.com/graphql"
+SEARCH_ISSUES_URL = "https://api.github.com/search/issues"
+
+# Repository events that can add or change a PR awaiting review
+PR_ACTIVITY_EVENTS = {"PullRequestEvent", "PushEvent"}
+
+# One round trip returns every open PR with the fields the reviewer uses
+OPEN_PRS_QUERY = """
+query($owner: String!, $name: String!, $labels: [String!], $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: OPEN, labels: $labels, first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        body
+        headRefOid
+        headRefName
+        baseRefName
+        author { login }
+        labels(first: 20) { nodes { name } }
+        comments(last: 50) { nodes { databaseId viewerDidAuthor body } }
+      }
+    }
+  }
+}
+"""
+
+# Static review instructions, kept apart from per-PR content so the "api"
+# backend can serve them from Anthropic's prompt cache
+REVIEW_RUBRIC = """Analyze the diff below for bugs, security issues, performance problems, and code quality. Check if tests are adequate and documentation is updated.
+
+Structure your review with sections: Summary, Code Quality, Potential Issues, Testing, Breaking Changes, Suggestions, and Overall Assessment."""
+
+# Heading that identifies the reviewer's own PR comments
+BOT_COMMENT_MARKER = "🤖 Claude AI Code Review"
+
+# Only meaningful for the "cli" backend, which runs inside a checkout
+RUN_INSTRUCTIONS = """Run any ETL pipelines and/or tests that were touched by this PR. Allow for a long timeout (up to 10 minutes) for individual etl pipelines, and 30 minutes if testing the full etl pipeline (only needed when changes affect the full pipeline or build process)."""
+
+# Digest of the review instructions; part of the review cache key so edited
+# instructions are not answered with reviews written under the old ones
+RUBRIC_DIGEST = hashlib.sha256(f"{REVIEW_RUBRIC}\n{RUN_INSTRUCTIONS}".encode("utf-8")).hexdigest()[:12]
+
+# Characters of diff included in the Claude prompt
+DIFF_BUDGET = 8192
+
+# File headers in a unified diff, e.g. "diff --git a/etl/x.py b/etl/x.py". Paths may
+# contain spaces, so "a/<path> b/<same path>" is tried before splitting a rename
+DIFF_HEADER_RE = re.compile(r'^diff --git a/(?:(?P<path>.+) b/(?P=path)|.+? b/(?P<renamed>.+))$', re.MULTILINE)
+
+# PRs cloned ahead of the ones currently being reviewed by Claude
+PREPARE_AHEAD = 2
+
+# Environment variables passed through to git subprocesses
+COMMAND_ENV_KEYS = ("PATH", "HOME", "USER", "LANG", "TMPDIR", "SSH_AUTH_SOCK")
+
+# Seconds before a GitHub request is abandoned (connect and read)
+HTTP_TIMEOUT = 30
+
+# Below this many remaining requests, wait for the rate limit to reset
+RATE_LIMIT_FLOOR = 50
+
+# Keep-alive connections kept open to GitHub
+HTTP_POOL_SIZE = 16
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,18 +121,77 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to every request"""
+    
+    def __init__(self, *args, timeout=HTTP_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+        
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
 class GitHubPRReviewer:
     def __init__(self, config):
         self.config = config
-        self.processed_prs = self.load_processed_prs()
+        # Guards processed_prs, the database and the review counter across worker threads
+        self.lock = threading.RLock()
         self.setup_directories()
+        self.db = self.open_processed_db()
+        self.processed_prs = self.load_processed_prs()
         self.total_prs_reviewed = 0
         self.caffeinate_process = None
+        self.mirror_path = self.config["review_dir"] / "mirror"
+        
+        # Minimal environment for git subprocesses: enough for config and
+        # credential helpers, and never blocks on an interactive prompt
+        self.command_env = {
+            key: os.environ[key] for key in COMMAND_ENV_KEYS if key in os.environ
+        }
+        self.command_env["GIT_TERMINAL_PROMPT"] = "0"
+        self.anthropic_client = None
+        
+        # One keep-alive session for every GitHub call so TCP/TLS is set up once
+        self.session = requests.Session()
+        # Pool sized for the concurrent review workers; transient 5xx/429 responses
+        # are retried with backoff (idempotent methods only, so comments never double-post)
+        self.session.mount("https://", TimeoutHTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        ))
+        self.session.headers.update({
+            "Authorization": f"token {self.config['github_token']}",
+            "Accept": "application/vnd.github.v3+json"
+        })
+        
+        # Minimum seconds between polls requested by GitHub via X-Poll-Interval
+        self.poll_interval = None
+        self.session.hooks["response"].append(self.record_poll_interval)
+        
+        # Epoch seconds when the rate limit resets, set once the budget runs low
+        self.rate_limit_reset = None
+        self.session.hooks["response"].append(self.record_rate_limit)
+        
+        # Conditional request caches: 304 responses do not count against the rate limit
+        self._pr_etags = {}
+        self._pr_cache = {}
+        self._events_etag = None
+        self._events_cache = []
+        self._last_event_id = None
+        # Set when a listing or review failed, so the next cycle lists PRs regardless of events
+        self._recheck_prs = False
+        self._comments_etags = {}
+        self._comments_cache = {}
         
     def setup_directories(self):
         """Create necessary directories"""
         self.config["review_dir"].mkdir(exist_ok=True)
         (self.config["review_dir"] / "pr_clones").mkdir(exist_ok=True)
+        (self.config["review_dir"] / "cache").mkdir(exist_ok=True)
         
     def start_caffeinate(self):
         """Start caffeinate to keep macOS awake"""
@@ -75,224 +219,535 @@ class GitHubPRReviewer:
                 if self.caffeinate_process:
                     self.caffeinate_process.kill()
         
-    def setup_directories(self):
-        """Create necessary directories"""
-        self.config["review_dir"].mkdir(exist_ok=True)
-        (self.config["review_dir"] / "pr_clones").mkdir(exist_ok=True)
+    def open_processed_db(self):
+        """Open the SQLite store of processed PRs, creating it if needed"""
+        db = sqlite3.connect(self.config["processed_db"], check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS processed ("
+            "pr_number INTEGER PRIMARY KEY, sha TEXT, reviewed_at TEXT, "
+            "title TEXT, bot_comment_id INTEGER)"
+        )
+        db.commit()
+        return db
         
     def load_processed_prs(self):
-        """Load list of already processed PRs"""
-        if self.config["processed_prs_file"].exists():
-            with open(self.config["processed_prs_file"], 'r') as f:
-                return json.load(f)
-        return {}
-        
-    def save_processed_prs(self):
-        """Save list of processed PRs"""
-        with open(self.config["processed_prs_file"], 'w') as f:
-            json.dump(self.processed_prs, f, indent=2)
-            
-    def get_open_prs(self):
-        """Fetch open PRs from GitHub API with the required label"""
-        headers = {
-            "Authorization": f"token {self.config['github_token']}",
-            "Accept": "application/vnd.github.v3+json"
+        """Load already processed PRs into the in-memory write-through cache"""
+        rows = self.db.execute(
+            "SELECT pr_number, sha, reviewed_at, title, bot_comment_id FROM processed"
+        ).fetchall()
+        if not rows:
+            # One-time import of the old JSON store, if there is one
+            try:
+                with open(self.config["processed_prs_file"], 'r') as f:
+                    processed_prs = json.load(f)
+            except FileNotFoundError:
+                return {}
+            logger.info(f"Importing {len(processed_prs)} processed PRs from {self.config['processed_prs_file']}")
+            for pr_number in processed_prs:
+                self.save_processed_pr(pr_number, processed_prs[pr_number])
+            return processed_prs
+        
+        return {
+            str(pr_number): {
+                key: value for key, value in (
+                    ("sha", sha), ("reviewed_at", reviewed_at),
+                    ("title", title), ("bot_comment_id", bot_comment_id)
+                ) if value is not None
+            }
+            for pr_number, sha, reviewed_at, title, bot_comment_id in rows
         }
         
-        url = f"https://api.github.com/repos/{self.config['repo_owner']}/{self.config['repo_name']}/pulls"
-        params = {"state": "open"}
+    def save_processed_pr(self, pr_number, record=None):
+        """Write one PR's record through to the database"""
+        with self.lock, self.db:
+            record = record if record is not None else self.processed_prs[str(pr_number)]
+            self.db.execute(
+                "INSERT INTO processed (pr_number, sha, reviewed_at, title, bot_comment_id) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(pr_number) DO UPDATE SET sha=excluded.sha, "
+                "reviewed_at=excluded.reviewed_at, title=excluded.title, "
+                "bot_comment_id=excluded.bot_comment_id",
+                (int(pr_number), record.get("sha"), record.get("reviewed_at"),
+                 record.get("title"), record.get("bot_comment_id"))
+            )
+            
+    def has_new_pr_activity(self):
+        """Check the repository events feed for PR activity since the last check
         
+        The feed is polled with an ETag, so an idle repository costs a free 304
+        and the full PR listing can be skipped.
+        """
+        url = f"https://api.github.com/repos/{self.config['repo_owner']}/{self.config['repo_name']}/events"
         try:
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            all_prs = response.json()
-            
-            # Filter PRs with the required label
-            labeled_prs = []
-            for pr in all_prs:
-                labels = [label['name'] for label in pr.get('labels', [])]
-                if self.config['required_label'] in labels:
-                    labeled_prs.append(pr)
+            self._events_etag, self._events_cache = self.conditional_get(
+                url, self._events_etag, self._events_cache, params={"per_page": 100}
+            )
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Failed to fetch repository events ({e}), listing PRs anyway")
+            return True
+        
+        new_events = [
+            event for event in self._events_cache
+            if self._last_event_id is None or int(event["id"]) > self._last_event_id
+        ]
+        first_check = self._last_event_id is None
+        if self._events_cache:
+            self._last_event_id = max(int(event["id"]) for event in self._events_cache)
+        
+        # A full page of unseen events may have pushed older ones out of the feed
+        if first_check or (new_events and len(new_events) == len(self._events_cache)):
+            return True
+        return any(event["type"] in PR_ACTIVITY_EVENTS for event in new_events)
+        
+    def get_open_prs(self):
+        """Fetch open PRs from GitHub API with the required label"""
+        try:
+            try:
+                labeled_prs = self.get_open_prs_graphql()
+            except requests.exceptions.HTTPError as e:
+                if e.response is None or e.response.status_code < 500:
+                    raise
+                logger.warning(f"GraphQL request failed ({e}), falling back to REST")
+                labeled_prs = self.get_open_prs_rest()
                     
             logger.info(f"Found {len(labeled_prs)} PRs with '{self.config['required_label']}' label")
             return labeled_prs
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to fetch PRs: {e}")
+            self._recheck_prs = True
             return []
             
-    def run_command(self, cmd, cwd=None, shell_escape=True):
-        """Run shell command and return output"""
-        try:
-            # For complex commands with quotes, use list format
-            if shell_escape and cmd.startswith("claude code"):
-                # Split the command properly to handle quotes
-                import shlex
-                cmd_list = shlex.split(cmd)
-                result = subprocess.run(
-                    cmd_list,
-                    capture_output=True,
-                    text=True,
-                    cwd=cwd,
-                    check=True
-                )
+    def get_open_prs_graphql(self):
+        """Fetch open PRs with the required label in a paginated GraphQL query
+        
+        The label filter is applied server-side, so unlabeled PRs are never sent.
+        """
+        variables = {
+            "owner": self.config['repo_owner'],
+            "name": self.config['repo_name'],
+            "labels": [self.config['required_label']],
+            "cursor": None
+        }
+        
+        prs = []
+        while True:
+            response = self.session.post(
+                GRAPHQL_URL,
+                json={"query": OPEN_PRS_QUERY, "variables": variables}
+            )
+            response.raise_for_status()
+            payload = response.json()
+            if payload.get("errors"):
+                raise requests.exceptions.RequestException(f"GraphQL errors: {payload['errors']}")
+            
+            pull_requests = payload["data"]["repository"]["pullRequests"]
+            prs.extend(self.pr_from_graphql_node(node) for node in pull_requests["nodes"])
+            
+            if not pull_requests["pageInfo"]["hasNextPage"]:
+                return prs
+            variables["cursor"] = pull_requests["pageInfo"]["endCursor"]
+            
+    def pr_from_graphql_node(self, node):
+        """Reshape a GraphQL PR node into the REST payload shape used elsewhere"""
+        author = node.get("author") or {}
+        return {
+            "number": node["number"],
+            "title": node["title"],
+            "body": node.get("body"),
+            "user": {"login": author.get("login", "ghost")},
+            "head": {"ref": node["headRefName"], "sha": node["headRefOid"]},
+            "base": {"ref": node["baseRefName"]},
+            "labels": [{"name": label["name"]} for label in node["labels"]["nodes"]],
+            # Our earlier review comment, so posting can skip listing comments
+            "bot_comment_id": next(
+                (comment["databaseId"] for comment in reversed(node["comments"]["nodes"])
+                 if comment["viewerDidAuthor"] and BOT_COMMENT_MARKER in comment["body"]),
+                None
+            )
+        }
+            
+    def get_open_prs_rest(self):
+        """Fetch open PRs with the required label through the REST search API
+        
+        Fallback when GraphQL is unavailable. Search filters by label on the
+        server; each match is then fetched for its head/base refs, with
+        per-PR ETags so unchanged PRs cost only a 304.
+        """
+        query = (
+            f"repo:{self.config['repo_owner']}/{self.config['repo_name']} "
+            f"is:pr is:open label:\"{self.config['required_label']}\""
+        )
+        response = self.session.get(SEARCH_ISSUES_URL, params={"q": query, "per_page": 100})
+        response.raise_for_status()
+        items = response.json()["items"]
+        
+        # Follow Link: rel="next" so more than one page of matches is complete
+        while "next" in response.links:
+            response = self.session.get(response.links["next"]["url"])
+            response.raise_for_status()
+            items.extend(response.json()["items"])
+        
+        prs = []
+        for item in items:
+            pr_number = item["number"]
+            self._pr_etags[pr_number], self._pr_cache[pr_number] = self.conditional_get(
+                item["pull_request"]["url"],
+                self._pr_etags.get(pr_number),
+                self._pr_cache.get(pr_number)
+            )
+            prs.append(self._pr_cache[pr_number])
+        return prs
+            
+    def record_poll_interval(self, response, *args, **kwargs):
+        """Remember the X-Poll-Interval GitHub asks clients to respect"""
+        poll_interval = response.headers.get("X-Poll-Interval")
+        if poll_interval and poll_interval.isdigit():
+            self.poll_interval = int(poll_interval)
+        return response
+        
+    def record_rate_limit(self, response, *args, **kwargs):
+        """Note the reset time when the remaining rate-limit budget runs low"""
+        # The search API has its own small per-minute budget; only track the main ones
+        if response.headers.get("X-RateLimit-Resource") == "search":
+            return response
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining and reset and remaining.isdigit() and reset.isdigit():
+            if int(remaining) < RATE_LIMIT_FLOOR:
+                self.rate_limit_reset = int(reset)
             else:
-                result = subprocess.run(
-                    cmd, 
-                    shell=True, 
-                    capture_output=True, 
-                    text=True, 
-                    cwd=cwd,
-                    check=True
-                )
-            return result.stdout
+                self.rate_limit_reset = None
+        return response
+        
+    def rate_limit_wait(self):
+        """Seconds until the rate limit resets if the budget is nearly spent, else 0"""
+        if self.rate_limit_reset is None:
+            return 0
+        return max(0, self.rate_limit_reset - int(time.time()) + 1)
+        
+    def conditional_get(self, url, etag, cached, params=None):
+        """GET with If-None-Match; returns (etag, json), reusing cached on 304"""
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self.session.get(url, headers=headers, params=params)
+        if response.status_code == 304:
+            return etag, cached
+        response.raise_for_status()
+        return response.headers.get("ETag"), response.json()
+            
+    def run_command(self, cmd, cwd=None):
+        """Run a command (argv list, no shell) and return its output"""
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                cwd=cwd,
+                env=self.command_env,
+                check=True
+            )
+            # Read raw bytes and decode once rather than through a text wrapper
+            return result.stdout.decode("utf-8", errors="replace")
         except subprocess.CalledProcessError as e:
-            logger.error(f"Command failed: {cmd[:100]}...")
-            logger.error(f"Error: {e.stderr}")
+            logger.error(f"Command failed: {shlex.join(cmd)[:100]}...")
+            logger.error(f"Error: {e.stderr.decode('utf-8', errors='replace')}")
             raise
             
-    def create_claude_prompt(self, pr_info, diff_content, files_changed):
-        """Create a detailed prompt for Claude"""
-        prompt = f'''Review this GitHub PR #{pr_info['number']} "{pr_info['title']}" by {pr_info['user']['login']}. 
-
-Description: {pr_info.get('body', 'No description provided')[:200]}
-
-Files changed ({len(files_changed)}): {', '.join(files_changed[:10])}{' and more' if len(files_changed) > 10 else ''}
+    def update_mirror(self):
+        """Create or refresh the local bare mirror that per-PR clones are made from"""
+        if not (self.mirror_path / "HEAD").exists():
+            logger.info(f"Creating local mirror: {self.mirror_path}")
+            repo_url = f"https://github.com/{self.config['repo_owner']}/{self.config['repo_name']}.git"
+            self.run_command(["git", "clone", "--mirror", repo_url, str(self.mirror_path)])
+        else:
+            # The mirror refspec (+refs/*:refs/*) also picks up refs/pull/*/head
+            logger.info("Refreshing local mirror...")
+            self.run_command(["git", "fetch", "--prune", "origin"], cwd=self.mirror_path)
+            
+    def fetch_diff(self, pr_number):
+        """Fetch the PR's unified diff and the files it touches in one request
+        
+        The response is streamed: only the first DIFF_BUDGET characters are kept
+        for the prompt, while file headers are collected from the whole diff.
+        """
+        url = f"https://api.github.com/repos/{self.config['repo_owner']}/{self.config['repo_name']}/pulls/{pr_number}"
+        diff_lines = []
+        diff_size = 0
+        files_changed = []
+        
+        with self.session.get(url, headers={"Accept": "application/vnd.github.v3.diff"}, stream=True) as response:
+            response.raise_for_status()
+            for raw_line in response.iter_lines(chunk_size=65536, delimiter=b"\n"):
+                line = raw_line.decode("utf-8", errors="replace")
+                match = DIFF_HEADER_RE.match(line)
+                if match:
+                    files_changed.append(match.group("path") or match.group("renamed"))
+                if diff_size < DIFF_BUDGET:
+                    diff_lines.append(line)
+                    diff_size += len(line) + 1
+        
+        diff_content = "\n".join(diff_lines)[:DIFF_BUDGET]
+        return diff_content, files_changed
+            
+    def format_pr_context(self, pr_info, files_changed):
+        """Describe the PR (title, author, description, files) for the prompt"""
+        return f'''Review this GitHub PR #{pr_info['number']} "{pr_info['title']}" by {pr_info['user']['login']}. 
 
-Analyze the diff below for bugs, security issues, performance problems, and code quality. Check if tests are adequate and documentation is updated. 
+Description: {(pr_info.get('body') or 'No description provided')[:200]}
 
-Run any ETL pipelines and/or tests that were touched by this PR. Allow for a long timeout (up to 10 minutes) for individual etl pipelines, and 30 minutes if testing the full etl pipeline (only needed when changes affect the full pipeline or build process).
+Files changed ({len(files_changed)}): {', '.join(files_changed[:10])}{' and more' if len(files_changed) > 10 else ''}'''
 
-Structure your review with sections: Summary, Code Quality, Potential Issues, Testing, Breaking Changes, Suggestions, and Overall Assessment.
+    def create_claude_prompt(self, pr_info, diff_content, files_changed, run_checks=True):
+        """Create a detailed prompt for Claude"""
+        run_instructions = f"\n{RUN_INSTRUCTIONS}\n" if run_checks else ""
+        prompt = f'''{self.format_pr_context(pr_info, files_changed)}
 
+{REVIEW_RUBRIC}
+{run_instructions}
 Diff:
-{diff_content[:8000]}
+{diff_content[:DIFF_BUDGET]}
 '''
         
         return prompt
 
-    def review_pr(self, pr):
-        """Review PR using temporary clone"""
+    def run_claude_cli(self, prompt, cwd):
+        """Run the Claude CLI in the clone with the prompt on stdin"""
+        logger.info("Running Claude review...")
+        logger.info(f"Working directory: {cwd}")
+        logger.info(f"Prompt length: {len(prompt)} characters")
+        
+        # Use the configured claude path
+        claude_cmd = self.config.get("claude_path", "claude")
+        logger.info(f"Using Claude command: {claude_cmd}")
+        
+        logger.info(f"First 100 chars of prompt: {prompt[:100]}...")
+        
+        # Run Claude with the in-memory prompt on stdin
+        timeout = self.config.get("claude_timeout", 1800)
+        logger.info(f"Running command: {claude_cmd} (with stdin, {timeout}-second timeout)")
+        
+        process = subprocess.Popen(
+            [claude_cmd],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=-1,
+            cwd=cwd
+        )
+        
+        try:
+            stdout, stderr = process.communicate(input=prompt.encode("utf-8"), timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # Don't leave a stalled Claude running (and holding the clone) after giving up
+            process.kill()
+            process.communicate()
+            raise
+        
+        # Decode the whole output once instead of incrementally through the locale codec
+        result = subprocess.CompletedProcess(
+            args=[claude_cmd],
+            returncode=process.returncode,
+            stdout=stdout.decode("utf-8", errors="replace"),
+            stderr=stderr.decode("utf-8", errors="replace")
+        )
+        
+        logger.info(f"Claude command return code: {result.returncode}")
+        logger.info(f"Claude stdout length: {len(result.stdout)} characters")
+        logger.info(f"Claude stderr length: {len(result.stderr)} characters")
+        
+        if result.returncode != 0:
+            logger.error(f"Claude command failed with return code {result.returncode}")
+            logger.error(f"stderr: {result.stderr}")
+            raise subprocess.CalledProcessError(result.returncode, [claude_cmd], result.stdout, result.stderr)
+        
+        return result.stdout
+
+    def run_claude_api(self, pr_info, diff_content, files_changed):
+        """Review the diff through the Anthropic Messages API with a cached rubric"""
+        try:
+            import anthropic
+        except ImportError:
+            raise RuntimeError("review_backend 'api' requires the anthropic package (pip install anthropic)")
+        
+        with self.lock:
+            if self.anthropic_client is None:
+                self.anthropic_client = anthropic.Anthropic()
+        
+        logger.info(f"Requesting review from {self.config['anthropic_model']} via the Messages API...")
+        response = self.anthropic_client.messages.create(
+            model=self.config["anthropic_model"],
+            max_tokens=self.config["anthropic_max_tokens"],
+            # Static rubric first so it forms the cached prefix; per-PR content last.
+            # Caching only engages once the prefix reaches the model's minimum length.
+            system=[{
+                "type": "text",
+                "text": REVIEW_RUBRIC,
+                "cache_control": {"type": "ephemeral"}
+            }],
+            messages=[{
+                "role": "user",
+                "content": f"{self.format_pr_context(pr_info, files_changed)}\n\nDiff:\n{diff_content[:DIFF_BUDGET]}"
+            }]
+        )
+        
+        usage = response.usage
+        logger.info(
+            f"Prompt cache: {usage.cache_read_input_tokens or 0} tokens read, "
+            f"{usage.cache_creation_input_tokens or 0} written, {usage.input_tokens} uncached"
+        )
+        return "".join(block.text for block in response.content if block.type == "text")
+
+    def needs_checkout(self, pr):
+        """Whether the PR asks for pipelines/tests to be run, which needs a clone"""
+        if self.config.get("review_backend", "cli") != "cli":
+            return False
+        return any(label['name'] == self.config['run_label'] for label in pr.get('labels', []))
+        
+    def prepare_review(self, pr):
+        """Clone the PR from the mirror and fetch its diff
+        
+        Safe to run in a worker thread: touches only its own temporary clone.
+        Returns (temp_clone_dir, diff_content, files_changed); temp_clone_dir
+        is None for diff-only reviews, which skip the clone entirely.
+        """
         pr_number = pr['number']
         branch_name = pr['head']['ref']
-        sha = pr['head']['sha']
         
-        logger.info(f"Starting review of PR #{pr_number}: {pr['title']}")
+        if not self.needs_checkout(pr):
+            logger.info(f"PR #{pr_number} has no '{self.config['run_label']}' label, reviewing diff only")
+            diff_content, files_changed = self.fetch_diff(pr_number)
+            return None, diff_content, files_changed
         
-        # Create temporary directory for clone
-        temp_clone_dir = None
+        # Create temporary directory
+        # Keep clones next to the mirror so cleanup can rename them on the same filesystem
+        temp_clone_dir = Path(tempfile.mkdtemp(
+            prefix=f"pr_{pr_number}_", dir=self.config["review_dir"] / "pr_clones"
+        ))
+        logger.info(f"Created temporary directory: {temp_clone_dir}")
         
         try:
-            # Create temporary directory
-            temp_clone_dir = Path(tempfile.mkdtemp(prefix=f"pr_{pr_number}_"))
-            logger.info(f"Created temporary directory: {temp_clone_dir}")
+            # Get diff and the list of changed files straight from the API
+            diff_content, files_changed = self.fetch_diff(pr_number)
             
-            # Clone repository
-            logger.info("Cloning repository...")
-            repo_url = f"https://github.com/{self.config['repo_owner']}/{self.config['repo_name']}.git"
+            # Clone from the local mirror without a worktree; --shared borrows
+            # the mirror's objects so no pack data is copied or downloaded, and
+            # only the base branch ref is written
+            logger.info(f"Cloning repository from local mirror for PR #{pr_number}...")
             self.run_command(
-                f"git clone {repo_url} .",
+                ["git", "clone", "--shared", "--no-checkout", "--single-branch", "--no-tags",
+                 "--branch", self.config['base_branch'], str(self.mirror_path), "."],
                 cwd=temp_clone_dir
             )
             
-            # Fetch PR branch
+            # Fetch PR branch (refs/pull/* are already in the mirror)
             logger.info(f"Fetching PR branch: {branch_name}")
             self.run_command(
-                f"git fetch origin pull/{pr_number}/head:pr_{pr_number}",
+                ["git", "fetch", "--no-tags", "origin", f"pull/{pr_number}/head:pr_{pr_number}"],
                 cwd=temp_clone_dir
             )
-            self.run_command(f"git checkout pr_{pr_number}", cwd=temp_clone_dir)
-            
-            # Create symlink to data directory
-            data_symlink = temp_clone_dir / "data"
-            if data_symlink.exists():
-                # Remove existing data directory if it exists
-                if data_symlink.is_symlink():
-                    data_symlink.unlink()
-                else:
-                    shutil.rmtree(data_symlink)
-            
-            logger.info(f"Creating symlink: {data_symlink} -> {self.config['data_path']}")
-            data_symlink.symlink_to(Path(self.config['data_path']))
             
-            # Get list of changed files
-            files_changed = self.run_command(
-                f"git diff --name-only origin/{self.config['base_branch']}...HEAD",
-                cwd=temp_clone_dir
-            ).strip().split('\n')
-            
-            # Get diff
-            diff_content = self.run_command(
-                f"git diff origin/{self.config['base_branch']}...HEAD",
+            # Only materialize the directories the PR touches plus the ones
+            # needed to run pipelines and tests; data/ is symlinked instead
+            sparse_dirs = self.sparse_checkout_dirs(files_changed)
+            logger.info(f"Sparse checkout of: {', '.join(sparse_dirs)}")
+            self.run_command(
+                ["git", "sparse-checkout", "set", "--cone", *sparse_dirs],
                 cwd=temp_clone_dir
             )
+            self.run_command(["git", "checkout", f"pr_{pr_number}"], cwd=temp_clone_dir)
             
-            # Create Claude prompt
-            prompt = self.create_claude_prompt(pr, diff_content, files_changed)
-            
-            # Run Claude review
-            logger.info("Running Claude review from temporary clone...")
-            logger.info(f"Working directory: {temp_clone_dir}")
-            logger.info(f"Prompt length: {len(prompt)} characters")
-            
-            # Use the configured claude path
-            claude_cmd = self.config.get("claude_path", "claude")
-            logger.info(f"Using Claude command: {claude_cmd}")
-            
-            # Write prompt to temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-                f.write(prompt)
-                prompt_file = f.name
+            # Create symlink to data directory; a data/ already in the
+            # checkout is left alone rather than deleted
+            data_symlink = temp_clone_dir / "data"
+            logger.info(f"Creating symlink: {data_symlink} -> {self.config['data_path']}")
+            try:
+                data_symlink.symlink_to(Path(self.config['data_path']))
+            except FileExistsError:
+                logger.warning(f"{data_symlink} already exists in the checkout, not replacing it")
             
+        except Exception:
+            self.cleanup_clone(temp_clone_dir)
+            raise
+        
+        return temp_clone_dir, diff_content, files_changed
+        
+    def sparse_checkout_dirs(self, files_changed):
+        """Top-level directories to check out for a PR, excluding data/"""
+        dirs = set(self.config['sparse_checkout_dirs'])
+        dirs.update(path.split("/", 1)[0] for path in files_changed if "/" in path)
+        dirs.discard("data")
+        return sorted(dirs)
+        
+    def cleanup_clone(self, temp_clone_dir):
+        """Remove a temporary clone directory without blocking the review loop
+        
+        The clone is renamed out of the way and deleted by a background rm -rf.
+        """
+        if temp_clone_dir and temp_clone_dir.exists():
+            logger.info(f"Cleaning up temporary directory: {temp_clone_dir}")
             try:
-                # Verify prompt file contents
-                with open(prompt_file, 'r') as f:
-                    prompt_content = f.read()
-                logger.info(f"Prompt length: {len(prompt_content)} characters")
-                logger.info(f"First 100 chars of prompt: {prompt_content[:100]}...")
-                
-                # Run Claude with stdin
-                logger.info(f"Running command: {claude_cmd} (with stdin, 30-minute timeout)")
-                logger.info(f"Working directory: {temp_clone_dir}")
-                
-                process = subprocess.Popen(
-                    [claude_cmd],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    cwd=temp_clone_dir
-                )
-                
-                stdout, stderr = process.communicate(input=prompt_content, timeout=1800)  # 30 minutes
-                
-                result = subprocess.CompletedProcess(
-                    args=[claude_cmd],
-                    returncode=process.returncode,
-                    stdout=stdout,
-                    stderr=stderr
+                trash_dir = temp_clone_dir.with_name(f"_trash_{uuid.uuid4().hex}")
+                os.rename(temp_clone_dir, trash_dir)
+                subprocess.Popen(
+                    ["rm", "-rf", str(trash_dir)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
                 )
+                logger.info(f"Temporary directory scheduled for removal: {trash_dir}")
+            except OSError as cleanup_error:
+                logger.warning(f"Background cleanup failed, removing in place: {cleanup_error}")
+                shutil.rmtree(temp_clone_dir, ignore_errors=True)
+
+    def cached_review_path(self, pr):
+        """Where the Claude output for this PR's head commit, backend and rubric is kept"""
+        backend = self.config.get("review_backend", "cli")
+        key = f"{pr['number']}-{pr['head']['sha']}-{backend}-{RUBRIC_DIGEST}"
+        return self.config["review_dir"] / "cache" / f"{key}.md"
+        
+    def review_pr(self, pr, prepared=None):
+        """Review PR using temporary clone
+        
+        prepared may be a Future for prepare_review(pr) started ahead of time.
+        """
+        pr_number = pr['number']
+        sha = pr['head']['sha']
+        
+        logger.info(f"Starting review of PR #{pr_number}: {pr['title']}")
+        
+        # Temporary directory for clone
+        temp_clone_dir = None
+        
+        try:
+            # Reuse the review of this exact commit if an earlier attempt got that far
+            cache_path = self.cached_review_path(pr)
+            if cache_path.exists():
+                logger.info(f"Using cached review for PR #{pr_number} at {sha[:7]}")
+                review_output = cache_path.read_text(encoding="utf-8")
+            else:
+                if prepared is None:
+                    temp_clone_dir, diff_content, files_changed = self.prepare_review(pr)
+                else:
+                    temp_clone_dir, diff_content, files_changed = prepared.result()
                 
-                logger.info(f"Claude command return code: {result.returncode}")
-                logger.info(f"Claude stdout length: {len(result.stdout)} characters")
-                logger.info(f"Claude stderr length: {len(result.stderr)} characters")
-                
-                if result.returncode != 0:
-                    logger.error(f"Claude command failed with return code {result.returncode}")
-                    logger.error(f"stderr: {result.stderr}")
-                    raise subprocess.CalledProcessError(result.returncode, [claude_cmd], result.stdout, result.stderr)
-                
-                review_output = result.stdout
-                
-                logger.info(f"Claude review completed, output length: {len(review_output)} characters")
-                logger.info(f"First 200 chars of output: {review_output[:200]}...")
+                # Run Claude review
+                if self.config.get("review_backend", "cli") == "api":
+                    review_output = self.run_claude_api(pr, diff_content, files_changed)
+                else:
+                    run_checks = temp_clone_dir is not None
+                    prompt = self.create_claude_prompt(pr, diff_content, files_changed, run_checks)
+                    review_output = self.run_claude_cli(
+                        prompt, temp_clone_dir if run_checks else self.config['repo_path']
+                    )
                 
-                if not review_output.strip():
-                    raise Exception("Claude returned empty output")
-                    
-            finally:
-                # Clean up prompt file
-                os.unlink(prompt_file)
+                if review_output.strip():
+                    cache_path.write_text(review_output, encoding="utf-8")
+            
+            logger.info(f"Claude review completed, output length: {len(review_output)} characters")
+            logger.info(f"First 200 chars of output: {review_output[:200]}...")
+            
+            if not review_output.strip():
+                raise Exception("Claude returned empty output")
             
             # Create and post review comment
             try:
@@ -305,24 +760,26 @@ Diff:
             
             try:
                 logger.info("Posting comment to GitHub...")
-                self.post_github_comment(pr_number, review_comment)
+                self.post_github_comment(pr_number, review_comment, pr.get("bot_comment_id"))
                 logger.info("Comment posted successfully")
             except Exception as e:
                 logger.error(f"Error posting GitHub comment: {e}")
                 raise Exception(f"Failed to post GitHub comment: {e}")
             
-            # Mark as processed
-            self.processed_prs[str(pr_number)] = {
-                "reviewed_at": datetime.now().isoformat(),
-                "sha": sha,
-                "title": pr['title']
-            }
-            self.save_processed_prs()
-            
-            # Increment review counter
-            self.total_prs_reviewed += 1
+            with self.lock:
+                # Mark as processed (keeps the stored bot_comment_id)
+                self.processed_prs.setdefault(str(pr_number), {}).update({
+                    "reviewed_at": datetime.now().isoformat(),
+                    "sha": sha,
+                    "title": pr['title']
+                })
+                self.save_processed_pr(pr_number)
+                
+                # Increment review counter
+                self.total_prs_reviewed += 1
+                total_reviewed = self.total_prs_reviewed
             
-            logger.info(f"Successfully reviewed PR #{pr_number} ({self.total_prs_reviewed} total reviewed)")
+            logger.info(f"Successfully reviewed PR #{pr_number} ({total_reviewed} total reviewed)")
             
         except Exception as e:
             logger.error(f"Failed to review PR #{pr_number}: {e}")
@@ -332,20 +789,60 @@ Diff:
             # Post error comment
             error_comment = self.format_error_comment(pr, str(e))
             try:
-                self.post_github_comment(pr_number, error_comment)
+                self.post_github_comment(pr_number, error_comment, pr.get("bot_comment_id"))
             except Exception as posting_error:
                 logger.error(f"Failed to post error comment: {posting_error}")
             raise
             
         finally:
             # Clean up temporary directory
-            if temp_clone_dir and temp_clone_dir.exists():
-                logger.info(f"Cleaning up temporary directory: {temp_clone_dir}")
-                try:
-                    shutil.rmtree(temp_clone_dir)
-                    logger.info("Temporary directory cleaned up successfully")
-                except Exception as cleanup_error:
-                    logger.error(f"Failed to clean up temporary directory: {cleanup_error}")
+            self.cleanup_clone(temp_clone_dir)
+                
+    def review_prs(self, prs):
+        """Review PRs concurrently, each in its own clone
+        
+        Up to review_workers reviews run at once; clones and diffs for the
+        next PREPARE_AHEAD PRs are prepared while those reviews are running.
+        """
+        # Never start more reviews than the remaining limit allows
+        if self.config['max_prs_to_review']:
+            remaining = self.config['max_prs_to_review'] - self.total_prs_reviewed
+            if remaining < len(prs):
+                logger.info(f"Review limit allows {max(remaining, 0)} of {len(prs)} new PRs")
+                prs = prs[:max(remaining, 0)]
+        if not prs:
+            return
+        
+        # Refresh once per batch so worker threads never fetch into the mirror concurrently
+        if any(self.needs_checkout(pr) for pr in prs):
+            self.update_mirror()
+        
+        review_workers = max(1, self.config.get('review_workers', 1))
+        window = review_workers + PREPARE_AHEAD
+        pending = deque(prs)
+        in_flight = {}
+        
+        with ThreadPoolExecutor(max_workers=window) as prepare_pool, \
+                ThreadPoolExecutor(max_workers=review_workers) as review_pool:
+            while pending or in_flight:
+                # Keep the window full; queued reviews wait on their clone being ready
+                while pending and len(in_flight) < window:
+                    pr = pending.popleft()
+                    logger.info(f"Found new/updated PR: #{pr['number']} - {pr['title']}")
+                    # A cached review needs no clone or diff
+                    if self.cached_review_path(pr).exists():
+                        prepared = None
+                    else:
+                        prepared = prepare_pool.submit(self.prepare_review, pr)
+                    in_flight[review_pool.submit(self.review_pr, pr, prepared)] = pr
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pr = in_flight.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to review PR #{pr['number']}: {e}")
                 
     def format_github_comment(self, pr, claude_output):
         """Format Claude's review for GitHub comment"""
@@ -391,54 +888,74 @@ The automated review could not be completed. Please review this PR manually or c
 
 <sub>This is an automated message from the Claude AI reviewer.</sub>"""
 
-    def post_github_comment(self, pr_number, comment_body):
-        """Post review as a comment on the PR"""
-        headers = {
-            "Authorization": f"token {self.config['github_token']}",
-            "Accept": "application/vnd.github.v3+json"
-        }
+    def post_github_comment(self, pr_number, comment_body, known_comment_id=None):
+        """Post review as a comment on the PR
         
-        # Check if we've already commented on this PR
-        existing_comments_url = f"https://api.github.com/repos/{self.config['repo_owner']}/{self.config['repo_name']}/issues/{pr_number}/comments"
+        known_comment_id is our existing comment as reported by the PR listing, if any.
+        """
+        repo_api_url = f"https://api.github.com/repos/{self.config['repo_owner']}/{self.config['repo_name']}"
+        comments_url = f"{repo_api_url}/issues/{pr_number}/comments"
+        payload = {"body": comment_body[:65000]}  # GitHub comment limit
+        with self.lock:
+            stored_comment_id = self.processed_prs.get(str(pr_number), {}).get("bot_comment_id")
         
         try:
-            # Get existing comments
-            response = requests.get(existing_comments_url, headers=headers)
-            response.raise_for_status()
-            existing_comments = response.json()
-            
-            # Look for our previous comment
-            bot_comment_id = None
-            for comment in existing_comments:
-                if "🤖 Claude AI Code Review" in comment.get('body', ''):
-                    bot_comment_id = comment['id']
-                    break
+            # Fast path: update the comment we posted last time without listing comments
+            bot_comment_id = known_comment_id or stored_comment_id
+            if bot_comment_id:
+                response = self.session.patch(
+                    f"{repo_api_url}/issues/comments/{bot_comment_id}",
+                    json=payload
+                )
+                if response.status_code != 404:
+                    response.raise_for_status()
+                    logger.info(f"Updated existing review comment on PR #{pr_number}")
+                    if stored_comment_id != bot_comment_id:
+                        self.remember_bot_comment(pr_number, bot_comment_id)
+                    return
+                logger.info(f"Stored review comment {bot_comment_id} no longer exists on PR #{pr_number}")
             
+            # Slow path: look for a previous comment of ours, then update or create
+            bot_comment_id = self.find_bot_comment(comments_url, pr_number)
             if bot_comment_id:
-                # Update existing comment
-                update_url = f"https://api.github.com/repos/{self.config['repo_owner']}/{self.config['repo_name']}/issues/comments/{bot_comment_id}"
-                response = requests.patch(
-                    update_url,
-                    headers=headers,
-                    json={"body": comment_body[:65000]}  # GitHub comment limit
+                response = self.session.patch(
+                    f"{repo_api_url}/issues/comments/{bot_comment_id}",
+                    json=payload
                 )
                 logger.info(f"Updated existing review comment on PR #{pr_number}")
             else:
-                # Create new comment
-                response = requests.post(
-                    existing_comments_url,
-                    headers=headers,
-                    json={"body": comment_body[:65000]}
-                )
+                response = self.session.post(comments_url, json=payload)
                 logger.info(f"Posted new review comment on PR #{pr_number}")
                 
             response.raise_for_status()
+            self.remember_bot_comment(pr_number, bot_comment_id or response.json()["id"])
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to post comment: {e}")
             if hasattr(e.response, 'text'):
                 logger.error(f"Response: {e.response.text}")
             
+    def remember_bot_comment(self, pr_number, comment_id):
+        """Store the id of our review comment on the PR"""
+        with self.lock:
+            self.processed_prs.setdefault(str(pr_number), {})["bot_comment_id"] = comment_id
+            self.save_processed_pr(pr_number)
+            
+    def find_bot_comment(self, comments_url, pr_number):
+        """Return the id of an earlier review comment on the PR, if any"""
+        etag, existing_comments = self.conditional_get(
+            comments_url,
+            self._comments_etags.get(pr_number),
+            self._comments_cache.get(pr_number, [])
+        )
+        self._comments_etags[pr_number] = etag
+        self._comments_cache[pr_number] = existing_comments
+        
+        for comment in existing_comments:
+            if BOT_COMMENT_MARKER in comment.get('body', ''):
+                return comment['id']
+        return None
+            
     def is_pr_processed(self, pr):
         """Check if PR has already been reviewed"""
         pr_number = str(pr['number'])
@@ -475,27 +992,29 @@ The automated review could not be completed. Please review this PR manually or c
                     break
                     
                 try:
-                    logger.info("Checking for new PRs with 'codex' label...")
-                    prs = self.get_open_prs()
+                    wait_seconds = self.rate_limit_wait()
+                    if wait_seconds:
+                        logger.warning(f"GitHub rate limit nearly exhausted, sleeping {wait_seconds} seconds until reset")
+                        time.sleep(wait_seconds)
+                        self.rate_limit_reset = None
+                    
+                    if self._recheck_prs or self.has_new_pr_activity():
+                        self._recheck_prs = False
+                        logger.info("Checking for new PRs with 'codex' label...")
+                        prs = self.get_open_prs()
+                    else:
+                        logger.info("No PR activity since the last check")
+                        prs = []
+                    
+                    new_prs = [pr for pr in prs if not self.is_pr_processed(pr)]
+                    self.review_prs(new_prs)
                     
-                    new_prs_count = 0
-                    for pr in prs:
-                        # Check limit again in case we're processing multiple PRs
-                        if (self.config['max_prs_to_review'] and 
-                            self.total_prs_reviewed >= self.config['max_prs_to_review']):
-                            logger.info("Reached review limit during processing")
-                            break
-                            
-                        if not self.is_pr_processed(pr):
-                            new_prs_count += 1
-                            logger.info(f"Found new/updated PR: #{pr['number']} - {pr['title']}")
-                            try:
-                                self.review_pr(pr)
-                            except Exception as e:
-                                logger.error(f"Failed to review PR #{pr['number']}: {e}")
-                                continue
+                    # Failed or deferred reviews are retried next cycle even without new events
+                    if any(self.processed_prs.get(str(pr['number']), {}).get('sha') != pr['head']['sha']
+                           for pr in new_prs):
+                        self._recheck_prs = True
                     
-                    if new_prs_count == 0:
+                    if not new_prs:
                         logger.info("No new PRs to review")
                     
                     # Exit if we've hit the limit
@@ -503,19 +1022,24 @@ The automated review could not be completed. Please review this PR manually or c
                         self.total_prs_reviewed >= self.config['max_prs_to_review']):
                         break
                                 
-                    logger.info(f"Check complete. Sleeping for {self.config['check_interval']} seconds...")
-                    time.sleep(self.config['check_interval'])
+                    # Never poll faster than GitHub asks us to
+                    sleep_seconds = max(self.config['check_interval'], self.poll_interval or 0)
+                    logger.info(f"Check complete. Sleeping for {sleep_seconds} seconds...")
+                    time.sleep(sleep_seconds)
                     
                 except KeyboardInterrupt:
                     logger.info("Received interrupt signal, shutting down...")
                     break
                 except Exception as e:
                     logger.error(f"Unexpected error in main loop: {e}")
-                    time.sleep(60)  # Wait a minute before retrying
+                    # Wait for the rate limit to reset if that is the problem, else a minute
+                    time.sleep(self.rate_limit_wait() or 60)
                     
         finally:
             # Always stop caffeinate when exiting
             self.stop_caffeinate()
+            self.session.close()
+            self.db.close()
             logger.info(f"Total PRs reviewed: {self.total_prs_reviewed}")
 
 if __name__ == "__main__":
@@ -534,14 +1058,16 @@ if __name__ == "__main__":
         logger.error("Please set your GitHub token in the GITHUB_TOKEN environment variable")
         exit(1)
         
-    if not Path(CONFIG["repo_path"]).exists():
+    # Diffs come from the API and checkouts from the mirror; repo_path is
+    # only the working directory for diff-only CLI reviews
+    try:
+        repo_is_dir = stat.S_ISDIR(os.stat(CONFIG["repo_path"]).st_mode)
+    except OSError:
+        repo_is_dir = False
+    if not repo_is_dir:
         logger.error(f"Repository path does not exist: {CONFIG['repo_path']}")
         exit(1)
         
-    if not (Path(CONFIG["repo_path"]) / ".git").exists():
-        logger.error(f"Path is not a git repository: {CONFIG['repo_path']}")
-        exit(1)
-        
     # Set up signal handler for clean exit
     def signal_handler(sig, frame):
         logger.info(f"Caught signal {sig}, cleaning up...")
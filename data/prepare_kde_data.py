@@ -12,13 +12,20 @@ Usage:
 """
 
 import argparse
+import copy
+import functools
+import hashlib
+import json
 import logging
 import os
 import requests
 import sys
+import threading
 import time
 import yaml
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional
 
 # Configure logging
@@ -28,6 +35,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bytes read per iteration when streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Concurrent downloads, and the overall request rate they share
+DOWNLOAD_WORKERS = 8
+REQUESTS_PER_SECOND = 4
+
+# libyaml's C loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(path: str, mtime: float) -> Dict:
+    """Parse a YAML config once per (path, modification time)"""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+def _load_config(path: str, mtime: float) -> Dict:
+    """Return a private copy of the cached config, so instances cannot change each other's"""
+    return copy.deepcopy(_parse_config(path, mtime))
+
+
 class KDEDownloader:
     """Prepares files from Kentucky Department of Education Historical Datasets"""
     
@@ -40,31 +70,95 @@ class KDEDownloader:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
-        with open(self.config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = _load_config(str(self.config_path), self.config_path.stat().st_mtime)
+        
+        # One keep-alive session shared by all download threads
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=DOWNLOAD_WORKERS))
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=DOWNLOAD_WORKERS))
+        self.session.headers.update(self.config["headers"])
+        
+        # Global rate limiting: request start times are spaced evenly across threads
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+    
+    def _throttle(self) -> None:
+        """Wait for this thread's turn under the shared request rate limit"""
+        with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + 1.0 / REQUESTS_PER_SECOND
+        time.sleep(start_at - now)
     
     def download_file(self, url: str, file_path: Path, timeout: int = 30) -> bool:
-        """Prepare a single file from KDE with retry logic"""
+        """Prepare a single file from KDE, resuming an interrupted download if possible
+        
+        Data is streamed to a .part file that only replaces file_path once complete,
+        so an aborted run never leaves a truncated file that later runs would skip.
+        """
+        part_path = file_path.with_name(file_path.name + ".part")
+        validator_path = file_path.with_name(file_path.name + ".part.json")
         try:
+            self._throttle()
             logger.info(f"Preparing {file_path.name}...")
-            response = requests.get(
+            
+            # Ask only for the missing bytes of the same URL, and only if the remote file is unchanged
+            headers = {}
+            existing_size = part_path.stat().st_size if part_path.exists() else 0
+            if existing_size and validator_path.exists():
+                stored = json.loads(validator_path.read_text())
+                if stored.get("url") == url and stored.get("validator"):
+                    headers = {"Range": f"bytes={existing_size}-", "If-Range": stored["validator"]}
+            
+            response = self.session.get(
                 url, 
-                headers=self.config["headers"],
+                headers=headers,
                 timeout=timeout,
                 stream=True
             )
+            
+            # 416: nothing lies past the .part file, e.g. a run stopped just before replacing
+            if response.status_code == 416 and headers:
+                response.close()
+                if response.headers.get("Content-Range", "").rpartition("/")[2] == str(existing_size):
+                    part_path.replace(file_path)
+                    validator_path.unlink(missing_ok=True)
+                    logger.info(f"✓ Downloaded: {file_path.name} ({existing_size:,} bytes, completed earlier)")
+                    return True
+                logger.info(f"Discarding unusable partial download of {file_path.name}")
+                part_path.unlink(missing_ok=True)
+                validator_path.unlink(missing_ok=True)
+                return self.download_file(url, file_path, timeout)
             response.raise_for_status()
             
             # Create parent directory if it doesn't exist
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write file in chunks to handle large files
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            digest = hashlib.sha256()
+            if response.status_code == 206:
+                logger.info(f"Resuming {file_path.name} from byte {existing_size:,}")
+                with open(part_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                mode = 'ab'
+                file_size = existing_size
+            else:
+                mode = 'wb'
+                file_size = 0
+                validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+                validator_path.write_text(json.dumps({"url": url, "validator": validator}))
+            
+            # Write file in chunks to handle large files, sizing and hashing as we go
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
+                    file_size += len(chunk)
+                    digest.update(chunk)
+            
+            part_path.replace(file_path)
+            validator_path.unlink(missing_ok=True)
             
-            file_size = file_path.stat().st_size
-            logger.info(f"✓ Downloaded: {file_path.name} ({file_size:,} bytes)")
+            logger.info(f"✓ Downloaded: {file_path.name} ({file_size:,} bytes, sha256 {digest.hexdigest()[:12]})")
             return True
             
         except requests.exceptions.RequestException as e:
@@ -85,6 +179,7 @@ class KDEDownloader:
         
         logger.info(f"Downloading {len(files)} files for {directory}")
         
+        work = []
         for filename in files:
             url = f"{self.config['base_url']}{filename}"
             file_path = target_dir / filename
@@ -95,13 +190,19 @@ class KDEDownloader:
                 results[filename] = True
                 continue
             
-            success = self.download_file(url, file_path)
-            results[filename] = success
-            
-            # Rate limiting - small delay between requests
-            time.sleep(0.5)
+            work.append((filename, url, file_path))
         
-        return results
+        # Downloads are I/O bound; _throttle keeps the pool within the rate limit
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(self.download_file, url, file_path): filename
+                for filename, url, file_path in work
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        # Report in configuration order
+        return {filename: results[filename] for filename in files}
     
     def download_all(self) -> Dict[str, Dict[str, bool]]:
         """Download all configured directories"""
@@ -110,9 +211,6 @@ class KDEDownloader:
         for directory in self.config["raw_directories"].keys():
             logger.info(f"\n=== Processing directory: {directory} ===")
             all_results[directory] = self.download_directory(directory)
-            
-            # Longer delay between directories
-            time.sleep(1.0)
         
         return all_results
     
@@ -181,7 +279,6 @@ Examples:
             for directory in args.directories:
                 logger.info(f"\n=== Processing directory: {directory} ===")
                 all_results[directory] = downloader.download_directory(directory)
-                time.sleep(1.0)
         else:
             # Download all directories
             all_results = downloader.download_all()
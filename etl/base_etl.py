@@ -7,35 +7,63 @@ to reduce code duplication and ensure consistency across modules.
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+import os
+import shutil
+import sys
+from tempfile import TemporaryDirectory
+from types import MappingProxyType
 try:
     from .constants import KPI_COLUMNS
+    from .demographic_mapper import DemographicMapper
 except ImportError:  # pragma: no cover - allow running as script
     from constants import KPI_COLUMNS
+    from demographic_mapper import DemographicMapper
 from pathlib import Path
 import pandas as pd
 from pydantic import BaseModel
-from typing import Dict, Any, Optional, Union, List
+from typing import Callable, Dict, Any, Deque, Iterator, Literal, Optional, Sequence, Union, List, Tuple
 import logging
 from datetime import datetime
-
-import sys
-from pathlib import Path
 import csv
 
-# Add etl directory to path for imports
-etl_dir = Path(__file__).parent
-sys.path.insert(0, str(etl_dir))
-
-from demographic_mapper import DemographicMapper
+# Optional pyarrow: Parquet output and the opt-in streaming CSV reader
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover - optional dependency
+    pa = pa_csv = None
 
 logger = logging.getLogger(__name__)
 
+# Opt in to pandas' future replace() behaviour (no silent downcasting) once at import
+pd.set_option("future.no_silent_downcasting", True)
+
 
 class Config(BaseModel):
     """Standard configuration model for all ETL modules."""
     rename: Dict[str, str] = {}
     dtype: Dict[str, str] = {}
     derive: Dict[str, Union[str, int, float]] = {}
+    # "parquet" also writes a zstd-compressed Parquet copy of the KPI CSV, batch by
+    # batch alongside it (needs pyarrow)
+    output_format: Literal["csv", "parquet"] = "csv"
+
+
+class RowView(dict):
+    """
+    Lightweight stand-in for a row ``pd.Series`` passed to per-row hooks.
+
+    Supports the parts of the Series API that ``extract_metrics`` and
+    ``get_suppressed_metric_defaults`` implementations rely on:
+    ``row.get(col)``, ``row[col]``, ``col in row`` and ``col in row.index``.
+    """
+
+    @property
+    def index(self):
+        return self.keys()
 
 
 class BaseETL(ABC):
@@ -50,8 +78,9 @@ class BaseETL(ABC):
     - Demographic mapping integration
     """
     
-    # Common column mappings used across all modules
-    COMMON_COLUMN_MAPPINGS = {
+    # Common column mappings used across all modules (read-only; modules extend
+    # them through module_column_mappings)
+    COMMON_COLUMN_MAPPINGS = MappingProxyType({
         # School year variations
         'School Year': 'school_year',
         'SCHOOL YEAR': 'school_year',
@@ -99,13 +128,58 @@ class BaseETL(ABC):
         # Suppression indicators
         'Suppressed': 'suppressed',
         'SUPPRESSED': 'suppressed',
-    }
+    })
     
-    # Common missing value indicators
-    MISSING_VALUE_INDICATORS = ['*', '**', '', 'N/A', 'n/a', '---', '--', '<10', '""']
+    # Common missing value indicators (ordered for DataFrame.replace, hashed for membership tests)
+    MISSING_VALUE_INDICATORS = ('*', '**', '', 'N/A', 'n/a', '---', '--', '<10', '""')
+    MISSING_VALUE_SET = frozenset(MISSING_VALUE_INDICATORS)
     
     # District aggregate row patterns to potentially filter
-    DISTRICT_AGGREGATE_PATTERNS = ['Total Events', '---District Total---', 'District Total', 'All Schools']
+    DISTRICT_AGGREGATE_PATTERNS = frozenset({'Total Events', '---District Total---', 'District Total', 'All Schools'})
+    
+    # Source column -> metric name for modules whose metrics are plain column
+    # renames; when set, the default extract_metrics_frame builds them in bulk
+    METRIC_COLUMNS: Dict[str, str] = {}
+    
+    # Upper bound on worker processes used to transform source files in process()
+    MAX_WORKERS = os.cpu_count() or 1
+    
+    # Source rows parsed and converted per chunk by process() and process_streaming_rows()
+    STREAM_CHUNK_ROWS = 50_000
+    
+    # KPI rows handed to the CSV writer at a time by process()
+    WRITE_BATCH_ROWS = 50_000
+    
+    # Buffer size for KPI output and part files, so large runs write in few syscalls
+    WRITE_BUFFER_BYTES = 4 * 1024 * 1024
+    
+    # Parse source CSVs with pyarrow's multithreaded streaming reader (needs pyarrow)
+    USE_PYARROW_CSV = False
+    
+    # Low-cardinality KPI output columns stored as categoricals
+    CATEGORICAL_KPI_COLUMNS = ('year', 'metric', 'district', 'school_id', 'school_name', 'student_group',
+                               'suppressed', 'source_file')
+    
+    # Source grade labels and their normalized values
+    GRADE_MAPPING = MappingProxyType({
+        'All Grades': 'all_grades',
+        'ALL GRADES': 'all_grades',
+        'Grade 1': 'grade_1',
+        'Grade 2': 'grade_2',
+        'Grade 3': 'grade_3',
+        'Grade 4': 'grade_4',
+        'Grade 5': 'grade_5',
+        'Grade 6': 'grade_6',
+        'Grade 7': 'grade_7',
+        'Grade 8': 'grade_8',
+        'Grade 9': 'grade_9',
+        'Grade 10': 'grade_10',
+        'Grade 11': 'grade_11',
+        'Grade 12': 'grade_12',
+        'Kindergarten': 'kindergarten',
+        'Pre-K': 'pre_k',
+        'Preschool': 'preschool'
+    })
     
     def __init__(self, source_name: Optional[str] = None):
         """
@@ -115,7 +189,21 @@ class BaseETL(ABC):
             source_name: Name of the data source (defaults to module filename)
         """
         self.source_name = source_name or self.__class__.__module__.split('.')[-1]
-        self.demographic_mapper = DemographicMapper()
+        self._demographic_mapper: Optional[DemographicMapper] = None
+        self._column_mappings: Optional[Dict[str, str]] = None
+        # last_updated stamp shared by every KPI record of a run
+        self._run_timestamp = datetime.now().isoformat()
+    
+    @property
+    def demographic_mapper(self) -> DemographicMapper:
+        """Demographic mapper, loaded from its YAML config on first use."""
+        if self._demographic_mapper is None:
+            self._demographic_mapper = DemographicMapper()
+        return self._demographic_mapper
+    
+    @demographic_mapper.setter
+    def demographic_mapper(self, mapper: DemographicMapper) -> None:
+        self._demographic_mapper = mapper
     
     @property
     @abstractmethod
@@ -156,16 +244,45 @@ class BaseETL(ABC):
         """
         pass
     
+    def extract_metrics_frame(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Optional vectorized counterpart of extract_metrics.
+        
+        Returns one column per metric (named by metric, aligned with df, NA
+        where absent) built only from source columns present in df.
+        convert_to_kpi_format then reshapes it to long format in one pass
+        instead of calling extract_metrics per row. Suppressed rows with no
+        values fall back to every returned column, mirroring
+        get_suppressed_metric_defaults.
+        
+        The default selects and renames the METRIC_COLUMNS present in df;
+        modules with value-dependent metrics leave METRIC_COLUMNS empty.
+        
+        Args:
+            df: Input DataFrame
+            
+        Returns:
+            DataFrame of metric columns, or None to use extract_metrics
+        """
+        if not self.METRIC_COLUMNS:
+            return None
+        
+        columns = {col: metric for col, metric in self.METRIC_COLUMNS.items() if col in df.columns}
+        return df[list(columns)].rename(columns=columns)
+    
     def get_column_mappings(self) -> Dict[str, str]:
         """
         Get combined column mappings (common + module-specific).
         
+        The merged dictionary is built on first use and shared afterwards,
+        so callers must not modify it.
+        
         Returns:
             Combined dictionary of column mappings
         """
-        mappings = self.COMMON_COLUMN_MAPPINGS.copy()
-        mappings.update(self.module_column_mappings)
-        return mappings
+        if self._column_mappings is None:
+            self._column_mappings = {**self.COMMON_COLUMN_MAPPINGS, **self.module_column_mappings}
+        return self._column_mappings
     
     def normalize_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -177,14 +294,15 @@ class BaseETL(ABC):
         Returns:
             DataFrame with normalized column names
         """
-        # Handle BOM encoding issues
-        if df.columns[0].startswith('﻿'):
-            df.columns.values[0] = df.columns[0].replace('﻿', '')
-        
-        # Apply column mappings
+        # Apply column mappings, ignoring a stray BOM on a header that was
+        # not read as utf-8-sig. One lookup per column and a new axis label
+        # list, without rename's per-label machinery or a data copy.
         column_mappings = self.get_column_mappings()
-        rename_dict = {col: column_mappings[col] for col in df.columns if col in column_mappings}
-        return df.rename(columns=rename_dict)
+        columns = []
+        for col in df.columns:
+            name = col.lstrip('\ufeff') if isinstance(col, str) else col
+            columns.append(column_mappings.get(name, name))
+        return df.set_axis(columns, axis=1, copy=False)
     
     def standardize_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -196,12 +314,13 @@ class BaseETL(ABC):
         Returns:
             DataFrame with standardized missing values
         """
-        # Replace missing indicators with pandas NA
-        pd.set_option("future.no_silent_downcasting", True)
-        for col in df.columns:
-            if df[col].dtype == "object":
-                result = df[col].replace(self.MISSING_VALUE_INDICATORS, pd.NA)
-                df[col] = result.infer_objects(copy=False)
+        # Mask missing indicators across all object columns with one hashed isin
+        # probe per cell, rather than one replace pass per indicator
+        object_columns = df.select_dtypes(include="object").columns
+        if len(object_columns):
+            values = df[object_columns]
+            result = values.mask(values.isin(self.MISSING_VALUE_INDICATORS), pd.NA)
+            df[object_columns] = result.infer_objects(copy=False)
         
         return df
     
@@ -275,6 +394,22 @@ class BaseETL(ABC):
         
         return cleaned_id
     
+    def _clean_school_id_series(self, school_ids: pd.Series) -> pd.Series:
+        """
+        Vectorized counterpart of _clean_school_id for a whole column.
+        
+        Args:
+            school_ids: Raw school ID values
+            
+        Returns:
+            Series of cleaned school ID strings
+        """
+        # Stringify once; both the missing check and the cleanup reuse it
+        school_id_strings = school_ids.astype(str)
+        missing = school_ids.isna() | (school_id_strings == '')
+        cleaned_ids = school_id_strings.str.strip().str.removesuffix('.0')
+        return cleaned_ids.mask(missing, 'unknown')
+    
     def extract_year(self, row: pd.Series) -> str:
         """
         Extract year from school_year field.
@@ -285,16 +420,29 @@ class BaseETL(ABC):
         Returns:
             4-digit year string
         """
-        year = row.get('school_year', '')
+        year = str(row.get('school_year', ''))
         
-        if len(str(year)) == 8:  # Format: YYYYYYYY (e.g., "20232024")
-            year = str(year)[-4:]  # Take last 4 digits (ending year)
-        elif len(str(year)) == 4:  # Already 4 digits
-            year = str(year)
-        else:
-            year = '2024'  # Default
+        if len(year) == 8:  # Format: YYYYYYYY (e.g., "20232024")
+            return year[-4:]  # Take last 4 digits (ending year)
+        if len(year) == 4:  # Already 4 digits
+            return year
+        return '2024'  # Default
+    
+    def extract_year_series(self, school_year: pd.Series) -> pd.Series:
+        """
+        Vectorized counterpart of extract_year for a whole school_year column.
         
-        return year
+        Args:
+            school_year: school_year values
+            
+        Returns:
+            Series of 4-digit year strings
+        """
+        school_year = school_year.astype(str)
+        year_length = school_year.str.len()
+        return school_year.str[-4:].where(
+            year_length == 8, school_year.where(year_length == 4, '2024')
+        )
     
     def standardize_school_name(self, school_name: str) -> str:
         """
@@ -336,30 +484,13 @@ class BaseETL(ABC):
         if 'grade' not in df.columns:
             return df
         
+        # Resolve each distinct grade label once, then broadcast
+        grades = df['grade'].astype(str)
         grade_mapping = {
-            'All Grades': 'all_grades',
-            'ALL GRADES': 'all_grades',
-            'Grade 1': 'grade_1',
-            'Grade 2': 'grade_2',
-            'Grade 3': 'grade_3',
-            'Grade 4': 'grade_4',
-            'Grade 5': 'grade_5',
-            'Grade 6': 'grade_6',
-            'Grade 7': 'grade_7',
-            'Grade 8': 'grade_8',
-            'Grade 9': 'grade_9',
-            'Grade 10': 'grade_10',
-            'Grade 11': 'grade_11',
-            'Grade 12': 'grade_12',
-            'Kindergarten': 'kindergarten',
-            'Pre-K': 'pre_k',
-            'Preschool': 'preschool'
+            grade: self.GRADE_MAPPING.get(grade, grade.lower().replace(' ', '_'))
+            for grade in grades.unique()
         }
-        
-        df['grade'] = df['grade'].astype(str)
-        df['grade'] = df['grade'].map(grade_mapping).fillna(
-            df['grade'].str.lower().str.replace(' ', '_')
-        )
+        df['grade'] = grades.map(grade_mapping)
         
         return df
     
@@ -367,6 +498,9 @@ class BaseETL(ABC):
         """
         Determine if a row should be skipped (e.g., district aggregates).
         
+        Single-row form; whole DataFrames are filtered with skip_rows_mask,
+        which must apply the same rules.
+        
         Args:
             row: Data row
             
@@ -375,15 +509,29 @@ class BaseETL(ABC):
         """
         demographic = row.get('demographic')
         
-        # Skip rows with missing demographics
-        if pd.isna(demographic):
+        # Skip rows with missing demographics (None, pd.NA or NaN) without
+        # dispatching through pd.isna
+        if demographic is None or demographic is pd.NA or demographic != demographic:
             return True
         
         # Skip district aggregate rows (can be overridden by subclasses)
-        if str(demographic) in self.DISTRICT_AGGREGATE_PATTERNS:
-            return True
+        return demographic in self.DISTRICT_AGGREGATE_PATTERNS
+    
+    def skip_rows_mask(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Vectorized counterpart of should_skip_row for a whole DataFrame.
+        
+        Args:
+            df: Input DataFrame
+            
+        Returns:
+            Boolean Series, True for rows that should be skipped
+        """
+        if 'demographic' not in df.columns:
+            return pd.Series(True, index=df.index)
         
-        return False
+        demographic = df['demographic']
+        return demographic.isna() | demographic.isin(self.DISTRICT_AGGREGATE_PATTERNS)
     
     def create_kpi_template(self, row: pd.Series, source_file: str) -> Dict[str, Any]:
         """
@@ -402,7 +550,7 @@ class BaseETL(ABC):
         
         # Map demographic using DemographicMapper
         original_demographic = row.get('demographic', 'All Students')
-        student_group = self.demographic_mapper.map_demographic(
+        student_group = self.demographic_mapper.lookup_demographic(
             original_demographic, year, source_file
         )
         
@@ -426,13 +574,82 @@ class BaseETL(ABC):
             'school_type': row.get('school_type', pd.NA),
             'suppressed': 'Y' if is_suppressed else 'N',
             'source_file': source_file,
-            'last_updated': datetime.now().isoformat()
+            'last_updated': self._run_timestamp
         }
     
+    def create_kpi_templates(self, df: pd.DataFrame, source_file: str) -> pd.DataFrame:
+        """
+        Create base KPI record templates for every row of a DataFrame.
+        
+        Vectorized counterpart of create_kpi_template: identifiers, year and
+        student group are computed column-wide instead of row by row.
+        
+        Args:
+            df: Input DataFrame (rows already filtered by skip_rows_mask)
+            source_file: Source filename
+            
+        Returns:
+            DataFrame of template fields, indexed like df
+            
+        Raises:
+            ValueError: If any row has no school code
+        """
+        def column(name: str, default: Any) -> pd.Series:
+            if name in df.columns:
+                return df[name]
+            return pd.Series(default, index=df.index, dtype=object)
+        
+        # School Code is required for every row (see extract_school_id)
+        school_code = column('school_code', '')
+        if (school_code.isna() | (school_code.astype(str) == '')).any():
+            logger.error("CRITICAL: No valid school ID found in row")
+            raise ValueError("No valid school ID found in row")
+        school_id = self._clean_school_id_series(school_code)
+        
+        year = self.extract_year_series(column('school_year', ''))
+        
+        # Each distinct demographic/year pair is mapped once
+        student_group = self.demographic_mapper.map_demographics_series(
+            column('demographic', 'All Students'), year, source_file
+        )
+        
+        # Standardize school names (see standardize_school_name)
+        school_name = column('school_name', 'Unknown School')
+        standardized_name = school_name.astype(str).str.strip()
+        standardized_name = standardized_name.mask(standardized_name == 'All Schools', '---District Total---')
+        standardized_name = standardized_name.mask(school_name.isna(), 'Unknown School')
+        
+        is_suppressed = column('suppressed', 'N').isin(['Y'])
+        
+        return pd.DataFrame({
+            'district': column('district_name', 'Unknown District'),
+            'school_id': school_id,
+            'school_name': standardized_name,
+            'year': year,
+            'student_group': student_group,
+            'county_number': column('county_number', pd.NA),
+            'county_name': column('county_name', pd.NA),
+            'district_number': column('district_number', pd.NA),
+            'school_code': column('school_code', pd.NA),
+            'state_school_id': column('state_school_id', pd.NA),
+            'nces_id': column('nces_id', pd.NA),
+            'co_op': column('co_op', pd.NA),
+            'co_op_code': column('co_op_code', pd.NA),
+            'school_type': column('school_type', pd.NA),
+            'suppressed': is_suppressed.map({True: 'Y', False: 'N'}),
+            'source_file': source_file,
+            'last_updated': self._run_timestamp
+        }, index=df.index)
+    
     def convert_to_kpi_format(self, df: pd.DataFrame, source_file: str) -> pd.DataFrame:
         """
         Convert data to standardized KPI format.
         
+        Template fields are built column-wide by create_kpi_templates. Metrics
+        come from extract_metrics_frame when a module provides it, otherwise
+        from the extract_metrics hook run per row on a RowView instead of a
+        materialized pd.Series.
+        
         Args:
             df: Input DataFrame
             source_file: Source filename
@@ -440,64 +657,129 @@ class BaseETL(ABC):
         Returns:
             DataFrame in KPI format
         """
-        kpi_rows = []
+        # Skip rows that shouldn't be processed
+        df = df[~self.skip_rows_mask(df)]
+        if df.empty:
+            logger.warning("No valid KPI rows created")
+            return pd.DataFrame()
         
-        for _, row in df.iterrows():
-            # Skip rows that shouldn't be processed
-            if self.should_skip_row(row):
-                continue
-            
-            # Create base KPI template
-            kpi_template = self.create_kpi_template(row, source_file)
+        # Create base KPI templates for all rows at once
+        templates = self.create_kpi_templates(df, source_file)
+        suppressed = (templates['suppressed'] == 'Y').tolist()
+        
+        # Long-form (template position, metric, value) triples
+        metrics_df = self.extract_metrics_frame(df)
+        if metrics_df is not None:
+            positions, metric_names, values = self._melt_metrics(metrics_df, suppressed)
+        else:
+            positions, metric_names, values = self._collect_row_metrics(df, suppressed)
+        
+        if not positions:
+            logger.warning("No valid KPI rows created")
+            return pd.DataFrame()
+        
+        return self._build_kpi_frame(templates, positions, metric_names, values)
+    
+    def _build_kpi_frame(self, templates: pd.DataFrame, positions: Sequence[int], metric_names: Sequence[str],
+                         values: Sequence[Any], suppressed: Optional[Sequence[str]] = None,
+                         value_dtype: str = 'Float64') -> pd.DataFrame:
+        """
+        Assemble long-format KPI rows from templates and (position, metric, value) columns.
+        
+        Each output row repeats the template at its position, so no per-record
+        dicts are built; the three columns are attached as whole arrays.
+        suppressed, when given, replaces the row-level flag with a per-record one.
+        value_dtype='Int64' keeps whole-number counts as integers in the CSV.
+        """
+        kpi_df = templates.iloc[positions].reset_index(drop=True)
+        kpi_df['metric'] = metric_names
+        # Nullable float keeps suppressed values as pd.NA without an object column
+        kpi_df['value'] = pd.array(values, dtype='Float64').astype(value_dtype)
+        if suppressed is not None:
+            kpi_df['suppressed'] = suppressed
+
+        # Only include columns that exist
+        available_columns = [col for col in KPI_COLUMNS if col in kpi_df.columns]
+        kpi_df = kpi_df[available_columns]
+        
+        # Repetitive labels are stored once per category instead of once per row
+        kpi_df = kpi_df.astype({col: 'category' for col in self.CATEGORICAL_KPI_COLUMNS if col in kpi_df.columns})
+        
+        return kpi_df
+    
+    def _collect_row_metrics(self, df: pd.DataFrame, suppressed: List[bool]) -> Tuple[List[int], List[str], List[Any]]:
+        """Run extract_metrics per row and return (position, metric, value) columns."""
+        positions: List[int] = []
+        metric_names: List[str] = []
+        values: List[Any] = []
+        
+        for position, record in enumerate(df.to_dict('records')):
+            row = RowView(record)
             
             # Extract metrics using module-specific logic
             metrics = self.extract_metrics(row)
             
             # Special handling for suppressed records: if no metrics extracted but record is suppressed,
             # create default metrics to ensure suppressed records are never lost
-            if not metrics and kpi_template['suppressed'] == 'Y':
+            if not metrics and suppressed[position]:
                 metrics = self.get_suppressed_metric_defaults(row)
             
-            # Create KPI rows for each metric
             for metric_name, value in metrics.items():
-                kpi_record = kpi_template.copy()
-                
                 # Handle suppression and value assignment
-                if kpi_template['suppressed'] == 'Y':
+                if suppressed[position]:
                     # For suppressed records, always include with NA value
-                    kpi_record['value'] = pd.NA
-                    kpi_record['metric'] = metric_name
-                    kpi_rows.append(kpi_record)
+                    value = pd.NA
                 else:
                     # For non-suppressed records, validate and clean the value
                     try:
                         if pd.notna(value) and value != '':
-                            kpi_record['value'] = float(value)
-                            kpi_record['metric'] = metric_name
-                            kpi_rows.append(kpi_record)
+                            value = float(value)
                         else:
                             continue  # Skip metrics with no value
                     except (ValueError, TypeError):
                         continue  # Skip invalid values
+                
+                positions.append(position)
+                metric_names.append(metric_name)
+                values.append(value)
         
-        if not kpi_rows:
-            logger.warning("No valid KPI rows created")
-            return pd.DataFrame()
+        return positions, metric_names, values
+    
+    def _melt_metrics(self, metrics_df: pd.DataFrame, suppressed: List[bool]) -> Tuple[List[int], List[str], List[Any]]:
+        """Reshape an extract_metrics_frame result to (position, metric, value) columns."""
+        # Row-major order (all metrics of a row together), as the per-row path emits them
+        long_df = (
+            metrics_df.set_axis(pd.RangeIndex(len(metrics_df)))
+            .melt(var_name='metric', value_name='value', ignore_index=False)
+            .sort_index(kind='stable')
+        )
+        row_suppressed = pd.Series(suppressed)[long_df.index].to_numpy()
+        present = long_df['value'].notna()
         
-        # Create KPI DataFrame with consistent column order
-        kpi_df = pd.DataFrame(kpi_rows)
-
-        # Only include columns that exist
-        available_columns = [col for col in KPI_COLUMNS if col in kpi_df.columns]
-        kpi_df = kpi_df[available_columns]
+        # Suppressed rows keep their present metrics, or every metric when none are present
+        row_has_metrics = present.groupby(level=0).transform('any')
+        keep_suppressed = row_suppressed & (present | ~row_has_metrics).to_numpy()
         
-        return kpi_df
+        # Other rows keep only values that parse as numbers
+        numeric = pd.to_numeric(long_df['value'].where(present), errors='coerce')
+        keep_numeric = ~row_suppressed & numeric.notna().to_numpy()
+        
+        keep = keep_suppressed | keep_numeric
+        values = numeric.astype(object).where(~row_suppressed, pd.NA)[keep]
+        return long_df.index[keep].tolist(), long_df['metric'][keep].tolist(), values.tolist()
     
     def process_streaming_rows(self, raw_dir: Path, proc_dir: Path, cfg: dict) -> None:
         """
-        True streaming processing: read → process → write row by row.
+        True streaming processing: read → process → write in bounded chunks.
         Memory-efficient alternative to process() method.
         
+        Each file is parsed STREAM_CHUNK_ROWS rows at a time by pandas' C
+        reader and every chunk goes through the same vectorized transforms
+        and convert_to_kpi_format as process(), so memory stays bounded by
+        the chunk size rather than the file size. Files are converted in
+        parallel worker processes (up to MAX_WORKERS) into part files that
+        are appended to the output in file order.
+        
         Args:
             raw_dir: Path to raw data directory
             proc_dir: Path to processed data directory  
@@ -516,152 +798,67 @@ class BaseETL(ABC):
             return
         
         logger.info(f"Found {len(csv_files)} files to process for {self.source_name} (streaming mode)")
+        self._run_timestamp = datetime.now().isoformat()
+        self.demographic_mapper.reset_lookups()
         
         # Set up streaming output
         output_path = proc_dir / f"{self.source_name}.csv"
         conf = Config(**cfg)
         total_kpi_rows = 0
-        files_processed = 0
         
         # Initialize demographic tracking for validation
         demographic_tracker = {}
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = None
-            header_written = False
+        workers = self._worker_count(len(csv_files))
+        with TemporaryDirectory(dir=proc_dir) as parts_dir, \
+                (ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()) as executor:
+            part_paths = [Path(parts_dir) / f"{i}.csv" for i in range(len(csv_files))]
+            file_args = list(zip(csv_files, part_paths))
+            if executor:
+                results = self._ordered_file_results(executor, self._stream_file, file_args, conf, workers + 1)
+            else:
+                results = (self._stream_file(csv_file, part_path, conf) for csv_file, part_path in file_args)
             
-            for csv_file in csv_files:
-                files_processed += 1
-                logger.info(f"Streaming {csv_file.name} ({files_processed}/{len(csv_files)})")
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=self.WRITE_BUFFER_BYTES) as csvfile:
+                header = None
+                parquet_writer = None
                 
-                try:
-                    # Check if file is empty before attempting to read
-                    if csv_file.stat().st_size == 0:
-                        logger.warning(f"Empty file (0 bytes): {csv_file.name}")
+                for (csv_file, part_path), result in zip(file_args, results):
+                    if result is None:
                         continue
                     
-                    file_kpi_rows = 0
+                    file_kpi_rows, file_tracker, audit_entries = result
+                    self.demographic_mapper.audit_log.extend(audit_entries)
+                    for year, student_groups in file_tracker.items():
+                        demographic_tracker.setdefault(year, set()).update(student_groups)
+                    if not file_kpi_rows:
+                        continue
                     
-                    # Stream read CSV file row by row
-                    with open(csv_file, 'r', encoding='utf-8-sig') as input_csv:
-                        reader = csv.DictReader(input_csv)
-                        
-                        # Process header normalization (first row only)
-                        if reader.fieldnames:
-                            # Create a mock DataFrame with just the header for normalization
-                            header_df = pd.DataFrame(columns=reader.fieldnames)
-                            header_df = self.normalize_column_names(header_df)
-                            normalized_fieldnames = list(header_df.columns)
+                    # Append the part in file order; the first part's header is the output's
+                    with open(part_path, newline='', encoding='utf-8') as part:
+                        part_header = part.readline()
+                        if header is None:
+                            header = part_header
+                            csvfile.write(header)
+                            if conf.output_format == "parquet":
+                                parquet_writer = self._open_parquet_writer(
+                                    output_path.with_suffix('.parquet'), next(csv.reader([header]))
+                                )
+                        if part_header == header:
+                            shutil.copyfileobj(part, csvfile)
                         else:
-                            logger.warning(f"No header found in {csv_file.name}")
-                            continue
-                        
-                        for row_num, raw_row in enumerate(reader, 1):
-                            try:
-                                # Progress logging for large files (every 10K rows)
-                                if row_num % 10000 == 0:
-                                    logger.info(f"  → Processing row {row_num:,} from {csv_file.name}")
-                                
-                                # Normalize column names and create pandas Series
-                                normalized_row = {}
-                                for old_col, new_col in zip(reader.fieldnames, normalized_fieldnames):
-                                    normalized_row[new_col] = raw_row.get(old_col, '')
-                                
-                                # Convert to pandas Series for processing
-                                row_series = pd.Series(normalized_row)
-                                
-                                # Apply standard transformations (row-level)
-                                row_series = self._standardize_row_missing_values(row_series)
-                                row_series = self._normalize_row_grade_field(row_series)
-                                row_series = self._add_row_derived_fields(row_series, conf.derive, csv_file.name)
-                                
-                                # Apply configuration-based transformations
-                                if conf.rename:
-                                    row_series = row_series.rename(index=conf.rename)
-                                
-                                # Enforce data types from configuration
-                                if conf.dtype:
-                                    for col, dtype in conf.dtype.items():
-                                        if col in row_series.index:
-                                            try:
-                                                if (dtype.lower().startswith('float') or 
-                                                    dtype.lower().startswith('int') or 
-                                                    dtype in ['Int64', 'Int32', 'Float64']):
-                                                    row_series[col] = pd.to_numeric(row_series[col], errors='coerce')
-                                                row_series[col] = pd.Series([row_series[col]]).astype(dtype).iloc[0]
-                                            except Exception as e:
-                                                logger.warning(f"Failed to convert {col} to {dtype} for row {row_num}: {e}")
-                                
-                                # Skip rows that shouldn't be processed
-                                if self.should_skip_row(row_series):
-                                    continue
-                                
-                                # Create base KPI template
-                                kpi_template = self.create_kpi_template(row_series, csv_file.name)
-                                
-                                # Extract metrics using module-specific logic
-                                metrics = self.extract_metrics(row_series)
-                                
-                                # Special handling for suppressed records
-                                if not metrics and kpi_template['suppressed'] == 'Y':
-                                    metrics = self.get_suppressed_metric_defaults(row_series)
-                                
-                                # Process each metric for this row
-                                for metric_name, value in metrics.items():
-                                    kpi_record = kpi_template.copy()
-                                    
-                                    # Handle suppression and value assignment
-                                    if kpi_template['suppressed'] == 'Y':
-                                        kpi_record['value'] = ''
-                                        kpi_record['metric'] = metric_name
-                                    else:
-                                        try:
-                                            if pd.notna(value) and value != '':
-                                                kpi_record['value'] = float(value)
-                                                kpi_record['metric'] = metric_name
-                                            else:
-                                                continue  # Skip metrics with no value
-                                        except (ValueError, TypeError):
-                                            continue  # Skip invalid values
-                                    
-                                    # Ensure school_id is string type
-                                    if 'school_id' in kpi_record:
-                                        kpi_record['school_id'] = str(kpi_record['school_id'])
-                                    
-                                    # Initialize CSV writer on first valid KPI record
-                                    if not header_written:
-                                        available_columns = [col for col in KPI_COLUMNS if col in kpi_record.keys()]
-                                        writer = csv.DictWriter(csvfile, fieldnames=available_columns)
-                                        writer.writeheader()
-                                        header_written = True
-                                    
-                                    # Track demographics for validation
-                                    year = str(kpi_record.get('year', ''))
-                                    student_group = str(kpi_record.get('student_group', ''))
-                                    if year and student_group:
-                                        if year not in demographic_tracker:
-                                            demographic_tracker[year] = set()
-                                        demographic_tracker[year].add(student_group)
-                                    
-                                    # Write KPI record immediately
-                                    row_dict = {col: kpi_record.get(col, '') for col in available_columns}
-                                    writer.writerow(row_dict)
-                                    file_kpi_rows += 1
-                                    total_kpi_rows += 1
-                                    
-                                    # Progress logging for KPI output (every 50K KPI rows)
-                                    if total_kpi_rows % 50000 == 0:
-                                        logger.info(f"  → Written {total_kpi_rows:,} total KPI rows")
-                                
-                            except Exception as e:
-                                logger.warning(f"Error processing row {row_num} in {csv_file.name}: {e}")
-                                continue
-                    
-                    logger.info(f"✓ Completed {csv_file.name}: {row_num:,} input rows → {file_kpi_rows:,} KPI rows (Total: {total_kpi_rows:,})")
-                    
-                except Exception as e:
-                    logger.error(f"Error processing {csv_file.name}: {e}")
-                    continue
+                            columns = next(csv.reader([header]))
+                            part_df = pd.read_csv(part, header=None, names=next(csv.reader([part_header])),
+                                                  dtype=str, keep_default_na=False)
+                            part_df.reindex(columns=columns).to_csv(csvfile, header=False, index=False)
+                    if parquet_writer is not None:
+                        self._append_parquet_part(parquet_writer, part_path)
+                    part_path.unlink()
+                    total_kpi_rows += file_kpi_rows
+                
+                if parquet_writer is not None:
+                    parquet_writer.close()
+                    logger.info(f"KPI data written to {output_path.with_suffix('.parquet')}")
         
         if total_kpi_rows == 0:
             logger.warning("No valid KPI data files processed")
@@ -680,55 +877,282 @@ class BaseETL(ABC):
         print(f"Wrote {output_path}")
         print(f"Demographic report: {proc_dir / f'{self.source_name}_demographic_report.md'}")
     
-    def _standardize_row_missing_values(self, row: pd.Series) -> pd.Series:
-        """Standardize missing values for a single row."""
-        for col in row.index:
-            if row[col] in self.MISSING_VALUE_INDICATORS:
-                row[col] = pd.NA
-        return row
+    def _stream_file(self, csv_file: Path, part_path: Path,
+                     conf: Config) -> Optional[Tuple[int, Dict[str, set], List[Dict[str, Any]]]]:
+        """
+        Convert one source file chunk by chunk into a part file for process_streaming_rows().
+        
+        Like _process_file, this may run in a worker process, so demographic
+        coverage and audit entries are handed back to the caller.
+        
+        Args:
+            csv_file: Source CSV file
+            part_path: CSV file to write this file's KPI rows (with header) to
+            conf: Parsed module configuration
+            
+        Returns:
+            (KPI row count, demographic tracker, audit entries), or None if the file was skipped
+        """
+        logger.info(f"Streaming {csv_file.name}")
+        audit_log = self.demographic_mapper.audit_log
+        audit_start = len(audit_log)
+        
+        try:
+            # Check if file is empty before attempting to read
+            if csv_file.stat().st_size == 0:
+                logger.warning(f"Empty file (0 bytes): {csv_file.name}")
+                return None
+            
+            file_rows = 0
+            file_kpi_rows = 0
+            demographic_tracker = {}
+            available_columns = None
+            
+            with open(part_path, 'w', newline='', encoding='utf-8', buffering=self.WRITE_BUFFER_BYTES) as part:
+                # Stream read CSV file chunk by chunk
+                for chunk in self._read_csv_chunks(csv_file):
+                    file_rows += len(chunk)
+                    try:
+                        kpi_df = self.convert_to_kpi_format(self._prepare_frame(chunk, conf, csv_file.name),
+                                                            csv_file.name)
+                    except Exception as e:
+                        logger.warning(f"Error processing rows up to {file_rows:,} in {csv_file.name}: {e}")
+                        continue
+                    
+                    if kpi_df.empty:
+                        continue
+                    
+                    # Fix the output columns from the first chunk that yields KPI records
+                    header = available_columns is None
+                    if header:
+                        available_columns = list(kpi_df.columns)
+                    
+                    # Track demographics for validation
+                    self._track_demographics(kpi_df, demographic_tracker)
+                    
+                    # Write the chunk's KPI records immediately; only chunks whose columns
+                    # differ from the first chunk's are reindexed (a full copy)
+                    if list(kpi_df.columns) != available_columns:
+                        kpi_df = kpi_df.reindex(columns=available_columns)
+                    else:
+                        kpi_df = kpi_df.copy(deep=False)
+                    kpi_df['school_id'] = kpi_df['school_id'].astype(str)
+                    kpi_df.to_csv(part, header=header, index=False)
+                    file_kpi_rows += len(kpi_df)
+                    
+                    logger.info(f"  → Written {file_kpi_rows:,} KPI rows from {csv_file.name}")
+            
+            logger.info(f"✓ Completed {csv_file.name}: {file_rows:,} input rows → {file_kpi_rows:,} KPI rows")
+            return file_kpi_rows, demographic_tracker, audit_log[audit_start:]
+        
+        except Exception as e:
+            logger.error(f"Error processing {csv_file.name}: {e}")
+            return None
+        
+        finally:
+            del audit_log[audit_start:]
+    
+    def _read_csv_chunks(self, csv_file: Path) -> Iterator[pd.DataFrame]:
+        """
+        Yield a source CSV as DataFrames of string columns, about STREAM_CHUNK_ROWS rows each.
+        
+        pandas' chunked C reader is used unless USE_PYARROW_CSV opts in to
+        pyarrow's multithreaded streaming reader. That path takes its header
+        from pandas, so duplicate and blank names are renamed the same way, and
+        hands the rest of the file to pandas at the first block pyarrow cannot
+        parse, such as one with a short row that pandas pads with NaN. Both read
+        every column as strings, treat pandas' default markers as missing and
+        give missing cells as NaN. No empty chunks are yielded, so a header-only
+        file never goes through the normalization chain.
+        """
+        if self.USE_PYARROW_CSV and pa_csv is None:
+            logger.warning("USE_PYARROW_CSV is set but pyarrow is not installed; reading with pandas")
+        if not self.USE_PYARROW_CSV or pa_csv is None:
+            yield from self._read_csv_chunks_pandas(csv_file)
+            return
+        
+        columns = pd.read_csv(csv_file, encoding='utf-8-sig', dtype=str, nrows=0).columns.tolist()
+        batches = []
+        rows = yielded = 0
+        try:
+            reader = pa_csv.open_csv(
+                csv_file,
+                read_options=pa_csv.ReadOptions(column_names=columns, skip_rows=1),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={col: pa.string() for col in columns},
+                    null_values=[*pa_csv.ConvertOptions().null_values, '<NA>', 'None'],
+                    strings_can_be_null=True,
+                ),
+            )
+            for batch in reader:
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows >= self.STREAM_CHUNK_ROWS:
+                    yield self._batches_to_frame(batches)
+                    yielded += rows
+                    batches, rows = [], 0
+        except pa.ArrowInvalid as e:
+            logger.info(f"pyarrow could not parse {csv_file.name} ({e}); reading it with pandas after row {yielded}")
+            yield from self._read_csv_chunks_pandas(csv_file, skip_rows=yielded)
+            return
+        if rows:
+            yield self._batches_to_frame(batches)
+    
+    def _read_csv_chunks_pandas(self, csv_file: Path, skip_rows: int = 0) -> Iterator[pd.DataFrame]:
+        """Yield non-empty pandas chunks of a source CSV, dropping its first skip_rows data rows."""
+        reader = pd.read_csv(csv_file, encoding='utf-8-sig', dtype=str, chunksize=self.STREAM_CHUNK_ROWS)
+        for chunk in reader:
+            if skip_rows:
+                dropped = min(skip_rows, len(chunk))
+                chunk = chunk.iloc[dropped:]
+                skip_rows -= dropped
+            if not chunk.empty:
+                yield chunk
     
-    def _normalize_row_grade_field(self, row: pd.Series) -> pd.Series:
-        """Normalize grade field for a single row."""
-        if 'grade' not in row.index:
-            return row
+    @staticmethod
+    def _batches_to_frame(batches: List[Any]) -> pd.DataFrame:
+        """Convert Arrow record batches to a DataFrame with NaN for missing strings."""
+        df = pa.Table.from_batches(batches).to_pandas()
+        return df.where(df.notna(), float('nan'))
+    
+    def _prepare_frame(self, df: pd.DataFrame, conf: Config, source_file: str) -> pd.DataFrame:
+        """
+        Apply the standard and configured transformations ahead of convert_to_kpi_format.
         
-        grade_mapping = {
-            'All Grades': 'all_grades',
-            'ALL GRADES': 'all_grades',
-            'Grade 1': 'grade_1',
-            'Grade 2': 'grade_2',
-            'Grade 3': 'grade_3',
-            'Grade 4': 'grade_4',
-            'Grade 5': 'grade_5',
-            'Grade 6': 'grade_6',
-            'Grade 7': 'grade_7',
-            'Grade 8': 'grade_8',
-            'Grade 9': 'grade_9',
-            'Grade 10': 'grade_10',
-            'Grade 11': 'grade_11',
-            'Grade 12': 'grade_12',
-            'Kindergarten': 'kindergarten',
-            'Pre-K': 'pre_k',
-            'Preschool': 'preschool'
-        }
+        Args:
+            df: Raw source rows, read as strings
+            conf: Parsed module configuration
+            source_file: Source filename
+            
+        Returns:
+            Transformed DataFrame
+        """
+        # Apply standard transformations
+        df = self.normalize_column_names(df)
+        df = self.standardize_missing_values(df)
+        df = self.normalize_grade_field(df)
+        df = self.add_derived_fields(df, conf.derive, source_file)
+
+        # Apply configuration-based transformations
+        if conf.rename:
+            df = df.rename(columns=conf.rename)
+
+        # Enforce data types from configuration (columns already of that dtype are left alone)
+        if conf.dtype:
+            for col, dtype in conf.dtype.items():
+                if col in df.columns and str(df[col].dtype) != dtype:
+                    try:
+                        series = df[col]
+                        # Handle numeric types (float, int, and nullable Int64)
+                        if dtype.lower().startswith(('float', 'int')):
+                            series = pd.to_numeric(series, errors='coerce')
+                        df[col] = series.astype(dtype, copy=False)
+                    except Exception as e:
+                        logger.warning(f"Failed to convert column {col} to {dtype}: {e}")
         
-        grade_value = str(row['grade'])
-        row['grade'] = grade_mapping.get(grade_value, grade_value.lower().replace(' ', '_'))
-        return row
+        return df
     
-    def _add_row_derived_fields(self, row: pd.Series, derive_config: Dict[str, Any], source_file: str) -> pd.Series:
-        """Add derived fields for a single row."""
-        for field, value in derive_config.items():
-            row[field] = value
+    def _process_file(self, csv_file: Path, conf: Config) -> Optional[Tuple[List[pd.DataFrame], int, List[Dict[str, Any]]]]:
+        """
+        Read, normalize and convert one source file for process().
+        
+        The file is parsed STREAM_CHUNK_ROWS rows at a time and each chunk is
+        converted on its own, so only one chunk of source rows is held in
+        memory next to the KPI frames produced so far. Runs in a worker
+        process when several files are processed, so the demographic audit
+        entries it records are handed back to the caller rather than left on
+        this (possibly copied) mapper.
+        
+        Args:
+            csv_file: Source CSV file
+            conf: Parsed module configuration
+            
+        Returns:
+            (KPI DataFrames, input row count, audit entries), or None if the file was skipped
+        """
+        logger.info(f"Processing {csv_file.name}")
+        audit_log = self.demographic_mapper.audit_log
+        audit_start = len(audit_log)
+        
+        try:
+            # Check if file is empty before attempting to read
+            if csv_file.stat().st_size == 0:
+                logger.warning(f"Empty file (0 bytes): {csv_file.name}")
+                return None
+            
+            # Read CSV file as strings, chunk by chunk, to avoid mixed-type warnings
+            # and keep large files out of memory
+            kpi_frames = []
+            input_rows = 0
+            for chunk in self._read_csv_chunks(csv_file):
+                input_rows += len(chunk)
+                
+                # Apply standard and configuration-based transformations
+                chunk = self._prepare_frame(chunk, conf, csv_file.name)
+                
+                # Convert to KPI format
+                kpi_df = self.convert_to_kpi_format(chunk, csv_file.name)
+                if not kpi_df.empty:
+                    kpi_frames.append(kpi_df)
+            
+            # Skip if empty DataFrame
+            if input_rows == 0:
+                logger.warning(f"Empty DataFrame: {csv_file.name}")
+                return None
+            
+            audit_entries = audit_log[audit_start:]
+            return kpi_frames, input_rows, audit_entries
+            
+        except Exception as e:
+            logger.error(f"Error processing {csv_file.name}: {e}")
+            return None
+        
+        finally:
+            del audit_log[audit_start:]
+    
+    def _worker_count(self, n_files: int) -> int:
+        """
+        Return how many worker processes to convert n_files with.
+        
+        Workers receive this ETL by pickling, which finds the class again by
+        module and qualified name. A class that cannot be found that way (a
+        module loaded from a file without registering it in sys.modules, or a
+        class defined inside a function) is processed serially instead.
+        """
+        cls = type(self)
+        found: Any = sys.modules.get(cls.__module__)
+        for name in cls.__qualname__.split('.'):
+            found = getattr(found, name, None)
+        if found is not cls:
+            logger.info(f"{cls.__qualname__} cannot be pickled by reference; processing files serially")
+            return 1
+        return min(self.MAX_WORKERS, n_files)
+    
+    def _ordered_file_results(self, executor: ProcessPoolExecutor, func: Callable[..., Any], items: Sequence[Any],
+                              conf: Config, window: int) -> Iterator[Any]:
+        """
+        Yield func(*item, conf) results in item order with at most window items in flight.
         
-        row['source_file'] = source_file
-        row['data_source'] = self.source_name
-        return row
+        Unlike executor.map, which submits every file up front, finished KPI
+        frames never pile up ahead of the writer, so peak memory stays at
+        about window files regardless of how many files the source has.
+        """
+        pending: Deque[Future] = deque()
+        for item in items:
+            args = item if isinstance(item, tuple) else (item,)
+            pending.append(executor.submit(func, *args, conf))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
     
     def process(self, raw_dir: Path, proc_dir: Path, cfg: dict) -> None:
         """
         Main transformation method with streaming output - template method pattern.
         
+        Source files are transformed in parallel worker processes (up to
+        MAX_WORKERS) and written to the output in file order.
+        
         Args:
             raw_dir: Path to raw data directory
             proc_dir: Path to processed data directory  
@@ -747,113 +1171,83 @@ class BaseETL(ABC):
             return
         
         logger.info(f"Found {len(csv_files)} files to process for {self.source_name}")
+        self._run_timestamp = datetime.now().isoformat()
+        self.demographic_mapper.reset_lookups()
         
         # Set up streaming output
         output_path = proc_dir / f"{self.source_name}.csv"
         conf = Config(**cfg)
         total_kpi_rows = 0
-        files_processed = 0
         
         # Initialize demographic tracking for validation
         demographic_tracker = {}
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = None
-            header_written = False
+        # Files are independent: transform them in worker processes, write in file order
+        workers = self._worker_count(len(csv_files))
+        with (ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()) as executor:
+            if executor:
+                # One file beyond the pool size keeps every worker busy while the writer runs
+                results = self._ordered_file_results(executor, self._process_file, csv_files, conf, workers + 1)
+            else:
+                results = (self._process_file(csv_file, conf) for csv_file in csv_files)
             
-            for csv_file in csv_files:
-                files_processed += 1
-                logger.info(f"Processing {csv_file.name} ({files_processed}/{len(csv_files)})")
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=self.WRITE_BUFFER_BYTES) as csvfile:
+                parquet_writer = None
+                available_columns = None
                 
-                try:
-                    # Check if file is empty before attempting to read
-                    if csv_file.stat().st_size == 0:
-                        logger.warning(f"Empty file (0 bytes): {csv_file.name}")
+                for csv_file, result in zip(csv_files, results):
+                    if result is None:
                         continue
                     
-                    # Read CSV file as strings to avoid mixed-type warnings and handle large files
-                    df = pd.read_csv(csv_file, encoding='utf-8-sig', dtype=str, low_memory=False)
-                    
-                    # Skip if empty DataFrame
-                    if df.empty:
-                        logger.warning(f"Empty DataFrame: {csv_file.name}")
-                        continue
-                    
-                    # Apply standard transformations
-                    df = self.normalize_column_names(df)
-                    df = self.standardize_missing_values(df)
-                    df = self.normalize_grade_field(df)
-                    df = self.add_derived_fields(df, conf.derive, csv_file.name)
-
-                    # Apply configuration-based transformations
-                    if conf.rename:
-                        df = df.rename(columns=conf.rename)
-
-                    # Enforce data types from configuration
-                    if conf.dtype:
-                        for col, dtype in conf.dtype.items():
-                            if col in df.columns:
-                                try:
-                                    # Handle numeric types (float, int, and nullable Int64)
-                                    if (dtype.lower().startswith('float') or 
-                                        dtype.lower().startswith('int') or 
-                                        dtype in ['Int64', 'Int32', 'Float64']):
-                                        df[col] = pd.to_numeric(df[col], errors='coerce')
-                                    df[col] = df[col].astype(dtype)
-                                except Exception as e:
-                                    logger.warning(f"Failed to convert column {col} to {dtype}: {e}")
-                    
-                    # Convert to KPI format
-                    kpi_df = self.convert_to_kpi_format(df, csv_file.name)
+                    kpi_frames, input_rows, audit_entries = result
+                    self.demographic_mapper.audit_log.extend(audit_entries)
+                    file_kpi_rows = 0
                     
-                    if not kpi_df.empty:
-                        # Ensure school_id is string type before writing
+                    for kpi_df in kpi_frames:
+                        # Ensure school_id is string type before writing. A shallow copy
+                        # is enough: assigning the column replaces it only in the copy
                         if 'school_id' in kpi_df.columns:
-                            kpi_df = kpi_df.copy()
+                            kpi_df = kpi_df.copy(deep=False)
                             kpi_df['school_id'] = kpi_df['school_id'].astype(str)
-                        
-                        # Initialize CSV writer on first valid data
-                        if not header_written:
+                    
+                        # Write the header on first valid data
+                        write_header = available_columns is None
+                        if write_header:
                             # Only include columns that exist in KPI_COLUMNS
                             available_columns = [col for col in KPI_COLUMNS if col in kpi_df.columns]
-                            kpi_df = kpi_df[available_columns]
-                            
-                            writer = csv.DictWriter(csvfile, fieldnames=available_columns)
-                            writer.writeheader()
-                            header_written = True
-                        else:
-                            # Ensure consistent column order for subsequent files
-                            available_columns = [col for col in KPI_COLUMNS if col in kpi_df.columns]
-                            kpi_df = kpi_df[available_columns]
+                            if conf.output_format == "parquet":
+                                parquet_writer = self._open_parquet_writer(
+                                    output_path.with_suffix('.parquet'), available_columns
+                                )
                         
-                        # Stream write KPI rows with progress logging for large datasets
-                        kpi_rows_written = 0
-                        for _, row in kpi_df.iterrows():
-                            # Track demographics for validation
-                            year = str(row.get('year', ''))
-                            student_group = str(row.get('student_group', ''))
-                            if year and student_group:
-                                if year not in demographic_tracker:
-                                    demographic_tracker[year] = set()
-                                demographic_tracker[year].add(student_group)
-                            
-                            # Write row to CSV
-                            row_dict = {col: row[col] if pd.notna(row[col]) else '' for col in available_columns}
-                            writer.writerow(row_dict)
-                            kpi_rows_written += 1
-                            
-                            # Progress logging for large files (every 50K rows)
-                            if kpi_rows_written % 50000 == 0:
-                                logger.info(f"  → Written {kpi_rows_written:,} KPI rows from {csv_file.name} ({kpi_rows_written/len(kpi_df)*100:.1f}%)")
+                        # Ensure consistent column order for subsequent files; frames that
+                        # already match the header are not reindexed (a full copy)
+                        if list(kpi_df.columns) != available_columns:
+                            kpi_df = kpi_df.reindex(columns=available_columns)
                         
-                        total_kpi_rows += len(kpi_df)
-                        logger.info(f"✓ Completed {csv_file.name}: {len(df)} → {len(kpi_df)} KPI rows (Running total: {total_kpi_rows:,})")
+                        # Track demographics for validation
+                        self._track_demographics(kpi_df, demographic_tracker)
+                        
+                        # pandas' writer emits each batch in bulk, missing values as empty fields
+                        for start in range(0, len(kpi_df), self.WRITE_BATCH_ROWS):
+                            batch = kpi_df.iloc[start:start + self.WRITE_BATCH_ROWS]
+                            batch.to_csv(csvfile, header=write_header and start == 0, index=False, na_rep='')
+                            if parquet_writer is not None:
+                                self._write_parquet_batch(parquet_writer, batch)
+                        
+                        file_kpi_rows += len(kpi_df)
+                        if len(kpi_frames) > 1:
+                            logger.info(f"  → Written {file_kpi_rows:,} KPI rows from {csv_file.name}")
+                    
+                    if file_kpi_rows:
+                        total_kpi_rows += file_kpi_rows
+                        logger.info(f"✓ Completed {csv_file.name}: {input_rows} → {file_kpi_rows} KPI rows (Running total: {total_kpi_rows:,})")
                     else:
                         logger.warning(f"No KPI data created from {csv_file.name}")
-                    
-                except Exception as e:
-                    logger.error(f"Error processing {csv_file.name}: {e}")
-                    continue
+                
+                if parquet_writer is not None:
+                    parquet_writer.close()
+                    logger.info(f"KPI data written to {output_path.with_suffix('.parquet')}")
         
         if total_kpi_rows == 0:
             logger.warning("No valid KPI data files processed")
@@ -897,6 +1291,18 @@ class BaseETL(ABC):
             )
         return results
     
+    @staticmethod
+    def _track_demographics(kpi_df: pd.DataFrame, demographic_tracker: Dict[str, set]) -> None:
+        """Add the (year, student_group) pairs of kpi_df to demographic_tracker.
+        
+        Pairs are deduplicated before they are stringified, so the Python work
+        scales with the handful of distinct pairs rather than the row count.
+        """
+        pairs = kpi_df[['year', 'student_group']].drop_duplicates().astype(str)
+        for year, student_groups in pairs.groupby('year', sort=False)['student_group']:
+            if year:
+                demographic_tracker.setdefault(year, set()).update(filter(None, student_groups))
+    
     def _validate_demographics_from_tracker(self, demographic_tracker: Dict[str, set]) -> List[Dict[str, List[str]]]:
         """Validate demographic coverage using tracked demographics from streaming processing.
         
@@ -931,11 +1337,66 @@ class BaseETL(ABC):
         self.demographic_mapper.save_audit_report(audit_path, validation_results)
         logger.info(f"Demographic report written to {audit_path}")
 
-    def _save_outputs(self, kpi_df: pd.DataFrame, proc_dir: Path, validation_results: List[Dict[str, List[str]]]) -> None:
+    def _write_parquet(self, kpi_df: pd.DataFrame, parquet_path: Path) -> None:
+        """Write a zstd-compressed Parquet copy of KPI data alongside the CSV output.
+        
+        Parquet is an optional extra; without pyarrow it is skipped with an
+        error so the CSV output (which the runner combines) is unaffected.
+        """
+        try:
+            kpi_df.to_parquet(parquet_path, compression='zstd', index=False)
+        except ImportError as e:
+            logger.error(f"Parquet output requested but unavailable: {e}")
+            return
+        logger.info(f"KPI data written to {parquet_path}")
+    
+    def _open_parquet_writer(self, parquet_path: Path, columns: Sequence[str]) -> Optional[Any]:
+        """Open a zstd-compressed Parquet writer for the KPI output, or None without pyarrow.
+        
+        The schema is fixed by the output columns (value is float64, every other
+        KPI column a string), so batches are appended as they are written to the CSV.
+        """
+        if pa is None:
+            logger.error("Parquet output requested but unavailable: pyarrow is not installed")
+            return None
+        import pyarrow.parquet as pq
+        
+        schema = pa.schema([(col, pa.float64() if col == 'value' else pa.string()) for col in columns])
+        return pq.ParquetWriter(parquet_path, schema, compression='zstd', compression_level=3)
+    
+    @staticmethod
+    def _write_parquet_batch(parquet_writer: Any, batch: pd.DataFrame) -> None:
+        """Append one batch of KPI rows to an open Parquet writer."""
+        dtypes = {col: 'Float64' if col == 'value' else 'string' for col in batch.columns}
+        table = pa.Table.from_pandas(batch.astype(dtypes), schema=parquet_writer.schema, preserve_index=False)
+        parquet_writer.write_table(table)
+    
+    @staticmethod
+    def _append_parquet_part(parquet_writer: Any, part_path: Path) -> None:
+        """Append a KPI part file written by _stream_file to an open Parquet writer.
+        
+        The part is read back by pyarrow batch by batch; columns it lacks are
+        written as nulls, and empty fields are read as nulls, as in the CSV.
+        """
+        schema = parquet_writer.schema
+        reader = pa_csv.open_csv(part_path, convert_options=pa_csv.ConvertOptions(
+            column_types=dict(zip(schema.names, schema.types)),
+            null_values=[''],
+            strings_can_be_null=True,
+            include_columns=schema.names,
+            include_missing_columns=True,
+        ))
+        for batch in reader:
+            parquet_writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+    
+    def _save_outputs(self, kpi_df: pd.DataFrame, proc_dir: Path, validation_results: List[Dict[str, List[str]]],
+                      output_format: str = "csv") -> None:
         """Save KPI data and demographic audit log. 
         
         NOTE: This method is deprecated in favor of streaming output in process().
         Kept for backward compatibility with modules that may still use it.
+        
+        With output_format="parquet" a Parquet copy is written next to the CSV.
         """
         # Save demographic mapping report
         audit_path = proc_dir / f"{self.source_name}_demographic_report.md"
@@ -943,11 +1404,14 @@ class BaseETL(ABC):
         
         # Write processed KPI data
         output_path = proc_dir / f"{self.source_name}.csv"
-        # Ensure school_id is string type before writing to prevent integer inference on read
+        # Ensure school_id is string type before writing to prevent integer inference on read.
+        # A shallow copy shares every other column with the caller's frame.
         if 'school_id' in kpi_df.columns:
-            kpi_df = kpi_df.copy()
+            kpi_df = kpi_df.copy(deep=False)
             kpi_df['school_id'] = kpi_df['school_id'].astype(str)
         kpi_df.to_csv(output_path, index=False)
+        if output_format == "parquet":
+            self._write_parquet(kpi_df, output_path.with_suffix('.parquet'))
         
         logger.info(f"KPI data written to {output_path}")
         logger.info(f"Demographic report written to {audit_path}")
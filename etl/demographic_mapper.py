@@ -19,7 +19,7 @@ Provides standardized demographic label mapping across all ETL pipelines to ensu
 consistent longitudinal reporting. Handles year-specific variations, naming
 inconsistencies, and new/removed categories.
 """
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 import pandas as pd
 import logging
 from pathlib import Path
@@ -47,6 +47,8 @@ class DemographicMapper:
         self.config_path = config_path
         self.mappings = self._load_mappings()
         self.audit_log = []
+        self._lookups: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self._lookup_entries: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
     
     def _load_mappings(self) -> Dict:
         """Load demographic mapping configuration."""
@@ -110,9 +112,87 @@ class DemographicMapper:
         self._log_mapping(original_demographic, original_demographic, year, source_file, "no_mapping")
         return original_demographic
     
-    def map_demographics_series(self, demographics: pd.Series, year: str, source_file: str = "unknown") -> pd.Series:
-        """Map an entire pandas Series of demographics."""
-        return demographics.apply(lambda x: self.map_demographic(x, year, source_file))
+    def build_lookup(self, demographics: Iterable[str], year: str, source_file: str = "unknown",
+                     counts: Optional[Mapping[str, int]] = None) -> Dict[str, str]:
+        """
+        Return a {raw demographic: standardized label} lookup covering demographics.
+        
+        Lookups are kept per (year, source_file), so each label is resolved once
+        however many rows or chunks of a file carry it. Its single audit entry
+        keeps a count of those rows, so reports still count mappings per row.
+        
+        Args:
+            demographics: Original demographic labels to cover
+            year: Data year (e.g., "2024")
+            source_file: Source filename for audit trail
+            counts: Rows carrying each label (one per label when omitted)
+            
+        Returns:
+            Lookup dictionary for the year and source file
+        """
+        lookup = self._lookups.setdefault((year, source_file), {})
+        entries = self._lookup_entries.setdefault((year, source_file), {})
+        for demographic in demographics:
+            rows = 1 if counts is None else counts[demographic]
+            if demographic in entries:
+                entries[demographic]["count"] += rows
+            elif demographic not in lookup:
+                logged = len(self.audit_log)
+                lookup[demographic] = self.map_demographic(demographic, year, source_file)
+                if len(self.audit_log) > logged:
+                    entries[demographic] = self.audit_log[-1]
+                    entries[demographic]["count"] = rows
+        return lookup
+    
+    def reset_lookups(self) -> None:
+        """Forget cached lookups, e.g. at the start of a new ETL run."""
+        self._lookups.clear()
+        self._lookup_entries.clear()
+    
+    def lookup_demographic(self, demographic: str, year: str, source_file: str = "unknown") -> str:
+        """
+        Map a single demographic label through the cached build_lookup table.
+        
+        Row-at-a-time callers get the same once-per-label resolution and
+        counted audit entry as map_demographics_series.
+        
+        Args:
+            demographic: Original demographic label
+            year: Data year (e.g., "2024")
+            source_file: Source filename for audit trail
+            
+        Returns:
+            Standardized demographic label
+        """
+        return self.build_lookup((demographic,), year, source_file)[demographic]
+    
+    def map_demographics_series(self, demographics: pd.Series, year: Union[str, pd.Series],
+                                source_file: str = "unknown") -> pd.Series:
+        """
+        Map an entire pandas Series of demographics.
+        
+        Rows are grouped by year and mapped through build_lookup, so each
+        distinct demographic is resolved once rather than once per row.
+        
+        Args:
+            demographics: Original demographic labels
+            year: Data year for all rows, or a Series of years aligned with demographics
+            source_file: Source filename for audit trail
+            
+        Returns:
+            Series of standardized demographic labels, indexed like demographics
+        """
+        if not isinstance(year, pd.Series):
+            counts = demographics.value_counts(sort=False)
+            lookup = self.build_lookup(counts.index, year, source_file, counts)
+            return demographics.map(lookup).fillna("All Students").astype(object)
+        
+        # Group on positions so duplicate index labels cannot cross years
+        positional = demographics.reset_index(drop=True)
+        mapped = pd.Series(index=positional.index, dtype=object)
+        for year_value, group in positional.groupby(year.to_numpy(), sort=False):
+            mapped[group.index] = self.map_demographics_series(group, year_value, source_file)
+        return mapped.set_axis(demographics.index)
     
     def validate_demographics(self, demographics: List[str], year: str) -> Dict[str, List[str]]:
         """
@@ -154,6 +234,7 @@ class DemographicMapper:
             "year": year,
             "source_file": source_file,
             "mapping_type": mapping_type,
+            "count": 1,
             "timestamp": pd.Timestamp.now().isoformat()
         })
     
@@ -190,7 +271,10 @@ class DemographicMapper:
                     lines.append(f"- {f}")
                 lines.append("")
 
-            mapping_counts = audit_df["mapping_type"].value_counts().to_dict()
+            # Entries shared by several rows carry their row count
+            mapping_counts = (
+                audit_df.groupby("mapping_type")["count"].sum().sort_values(ascending=False).to_dict()
+            )
             lines.append("## Mapping Types")
             for mtype, count in mapping_counts.items():
                 lines.append(f"- {mtype}: {count}")
@@ -74,6 +74,16 @@ def handle_suppression_fields(df: pd.DataFrame) -> pd.DataFrame:
 class GraduationRatesETL(BaseETL):
     """ETL module for processing graduation rates data."""
     
+    # Source columns and the KPI metrics they map to one-to-one (see BaseETL.extract_metrics_frame)
+    METRIC_COLUMNS = {
+        'graduation_rate_4_year': 'graduation_rate_4_year',
+        'grads_4_year_cohort': 'graduation_count_4_year',
+        'students_4_year_cohort': 'graduation_total_4_year',
+        'graduation_rate_5_year': 'graduation_rate_5_year',
+        'grads_5_year_cohort': 'graduation_count_5_year',
+        'students_5_year_cohort': 'graduation_total_5_year',
+    }
+    
     @property
     def module_column_mappings(self) -> Dict[str, str]:
         return {
@@ -96,49 +106,16 @@ class GraduationRatesETL(BaseETL):
         }
     
     def extract_metrics(self, row: pd.Series) -> Dict[str, Any]:
-        metrics = {}
-        
-        # Process 4-year graduation metrics
-        if 'graduation_rate_4_year' in row and pd.notna(row['graduation_rate_4_year']):
-            metrics['graduation_rate_4_year'] = row['graduation_rate_4_year']
-        
-        if 'grads_4_year_cohort' in row and pd.notna(row['grads_4_year_cohort']):
-            metrics['graduation_count_4_year'] = row['grads_4_year_cohort']
-        
-        if 'students_4_year_cohort' in row and pd.notna(row['students_4_year_cohort']):
-            metrics['graduation_total_4_year'] = row['students_4_year_cohort']
-        
-        # Process 5-year graduation metrics
-        if 'graduation_rate_5_year' in row and pd.notna(row['graduation_rate_5_year']):
-            metrics['graduation_rate_5_year'] = row['graduation_rate_5_year']
-        
-        if 'grads_5_year_cohort' in row and pd.notna(row['grads_5_year_cohort']):
-            metrics['graduation_count_5_year'] = row['grads_5_year_cohort']
-        
-        if 'students_5_year_cohort' in row and pd.notna(row['students_5_year_cohort']):
-            metrics['graduation_total_5_year'] = row['students_5_year_cohort']
-        
-        return metrics
+        """Per-row counterpart of extract_metrics_frame, built from METRIC_COLUMNS."""
+        return {
+            metric: row[col] for col, metric in self.METRIC_COLUMNS.items()
+            if col in row and pd.notna(row[col])
+        }
     
     def get_suppressed_metric_defaults(self, row: pd.Series) -> Dict[str, Any]:
         """Get default metrics for suppressed graduation records."""
-        defaults = {}
-        
         # Only create defaults for metrics that exist in the source data
-        if 'graduation_rate_4_year' in row.index:
-            defaults['graduation_rate_4_year'] = pd.NA
-        if 'grads_4_year_cohort' in row.index:
-            defaults['graduation_count_4_year'] = pd.NA
-        if 'students_4_year_cohort' in row.index:
-            defaults['graduation_total_4_year'] = pd.NA
-        if 'graduation_rate_5_year' in row.index:
-            defaults['graduation_rate_5_year'] = pd.NA
-        if 'grads_5_year_cohort' in row.index:
-            defaults['graduation_count_5_year'] = pd.NA
-        if 'students_5_year_cohort' in row.index:
-            defaults['graduation_total_5_year'] = pd.NA
-            
-        return defaults
+        return {metric: pd.NA for col, metric in self.METRIC_COLUMNS.items() if col in row.index}
     
     def standardize_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """Override to include graduation-specific missing value handling."""
@@ -39,7 +39,8 @@ class KentuckySummativeAssessmentETL(BaseETL):
         
         for chunk_idx, start_idx in enumerate(range(0, len(df), chunk_size)):
             end_idx = min(start_idx + chunk_size, len(df))
-            chunk_df = df.iloc[start_idx:end_idx].copy()
+            # convert_to_kpi_format never mutates its input, so a view is enough
+            chunk_df = df.iloc[start_idx:end_idx]
             
             chunk_start = time.time()
             logger.info(f"Processing chunk {chunk_idx + 1}: rows {start_idx:,} to {end_idx:,}")
@@ -235,6 +235,28 @@ class KindergartenReadinessETL(BaseETL):
             template['suppressed'] = 'N'
             
         return template
+    
+    def create_kpi_templates(self, df: pd.DataFrame, source_file: str) -> pd.DataFrame:
+        """
+        Vectorized counterpart of create_kpi_template's suppression override.
+        """
+        templates = super().create_kpi_templates(df, source_file)
+        
+        def present(column: str) -> pd.Series:
+            if column in df.columns:
+                return df[column].notna()
+            return pd.Series(False, index=df.index)
+        
+        has_readiness_data = (
+            present("total_percent_ready") |
+            present("total_ready_count") |
+            (present("ready_with_interventions_count") &
+             present("ready_count") &
+             present("ready_with_enrichments_count"))
+        )
+        templates.loc[has_readiness_data, 'suppressed'] = 'N'
+        
+        return templates
 
 
 def transform(raw_dir: Path, proc_dir: Path, cfg: dict) -> None:
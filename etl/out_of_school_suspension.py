@@ -14,11 +14,7 @@ import sys
 etl_dir = Path(__file__).parent
 sys.path.insert(0, str(etl_dir))
 
-from base_etl import BaseETL
-try:
-    from constants import KPI_COLUMNS
-except ImportError:
-    KPI_COLUMNS = []
+from base_etl import BaseETL, RowView
 
 logger = logging.getLogger(__name__)
 
@@ -177,35 +173,36 @@ class OutOfSchoolSuspensionETL(BaseETL):
 
     def convert_to_kpi_format(self, df: pd.DataFrame, source_file: str) -> pd.DataFrame:
         """Override to apply metric-level suppression handling."""
-        kpi_records = []
-        for _, row in df.iterrows():
-            if self.should_skip_row(row):
-                continue
-            kpi_template = self.create_kpi_template(row, source_file)
+        # Drop rows that shouldn't be processed in one vectorized pass
+        df = df[~self.skip_rows_mask(df)]
+        if df.empty:
+            return pd.DataFrame()
+        templates = self.create_kpi_templates(df, source_file)
+
+        # Per-record (template position, metric, value, suppressed) columns
+        positions, metric_names, values, suppressed = [], [], [], []
+        for position, record in enumerate(df.to_dict('records')):
+            row = RowView(record)
             metrics = self.extract_metrics(row)
             if not metrics and row.get('suppressed') == 'Y':
                 metrics = self.get_suppressed_metric_defaults(row)
             for metric, value in metrics.items():
-                record = kpi_template.copy()
                 try:
                     if pd.isna(value):
                         raise ValueError('missing')
                     numeric_val = float(value)
                     if numeric_val < 0:
                         raise ValueError('negative')
-                    record['value'] = numeric_val
-                    record['suppressed'] = 'N'
+                    values.append(numeric_val)
+                    suppressed.append('N')
                 except Exception:
-                    record['value'] = pd.NA
-                    record['suppressed'] = 'Y'
-                record['metric'] = metric
-                kpi_records.append(record)
-        if not kpi_records:
+                    values.append(pd.NA)
+                    suppressed.append('Y')
+                positions.append(position)
+                metric_names.append(metric)
+        if not positions:
             return pd.DataFrame()
-        kpi_df = pd.DataFrame(kpi_records)
-        # Use standard KPI columns, only including those that exist
-        available_columns = [col for col in KPI_COLUMNS if col in kpi_df.columns]
-        return kpi_df[available_columns]
+        return self._build_kpi_frame(templates, positions, metric_names, values, suppressed)
 
 
 def transform(raw_dir: Path, proc_dir: Path, cfg: dict) -> None:
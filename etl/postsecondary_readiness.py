@@ -68,6 +68,12 @@ class PostsecondaryReadinessETL(BaseETL):
             'POSTSECONDARY RATE WITH BONUS': 'postsecondary_rate_with_bonus',
         }
     
+    # Metrics always emitted for every row, and the source rate column each reads
+    RATE_METRICS = {
+        'postsecondary_readiness_rate': 'postsecondary_rate',
+        'postsecondary_readiness_rate_with_bonus': 'postsecondary_rate_with_bonus',
+    }
+    
     def extract_metrics(self, row: pd.Series) -> Dict[str, Any]:
         metrics = {}
         
@@ -94,55 +100,30 @@ class PostsecondaryReadinessETL(BaseETL):
         """
         Override to ensure both postsecondary metrics are always created together.
         """
-        kpi_rows = []
-        
-        for _, row in df.iterrows():
-            if self.should_skip_row(row):
-                continue
-            
-            kpi_template = self.create_kpi_template(row, source_file)
-            metrics = self.extract_metrics(row)
-            
-            # Special handling for postsecondary readiness: always create both metrics
-            base_value = metrics.get('postsecondary_readiness_rate')
-            bonus_value = metrics.get('postsecondary_readiness_rate_with_bonus')
-            
-            # Create base rate record
-            base_record = kpi_template.copy()
-            base_record['metric'] = 'postsecondary_readiness_rate'
-            if kpi_template['suppressed'] == 'Y' or pd.isna(base_value):
-                base_record['value'] = pd.NA
-            else:
-                try:
-                    base_record['value'] = float(base_value)
-                except (ValueError, TypeError):
-                    base_record['value'] = pd.NA
-            kpi_rows.append(base_record)
-            
-            # Create bonus rate record  
-            bonus_record = kpi_template.copy()
-            bonus_record['metric'] = 'postsecondary_readiness_rate_with_bonus'
-            if kpi_template['suppressed'] == 'Y' or pd.isna(bonus_value):
-                bonus_record['value'] = pd.NA
-            else:
-                try:
-                    bonus_record['value'] = float(bonus_value)
-                except (ValueError, TypeError):
-                    bonus_record['value'] = pd.NA
-            kpi_rows.append(bonus_record)
-        
-        if not kpi_rows:
+        # Drop rows that shouldn't be processed in one vectorized pass
+        df = df[~self.skip_rows_mask(df)]
+        if df.empty:
             logger.warning("No valid KPI rows created")
             return pd.DataFrame()
         
-        # Create KPI DataFrame with consistent column order
-        kpi_df = pd.DataFrame(kpi_rows)
-
-        # Only include columns that exist
-        available_columns = [col for col in KPI_COLUMNS if col in kpi_df.columns]
-        kpi_df = kpi_df[available_columns]
+        templates = self.create_kpi_templates(df, source_file)
+        
+        # Special handling for postsecondary readiness: always create both metrics,
+        # with NA values for suppressed records and missing or invalid rates
+        rates = pd.DataFrame({
+            metric: (pd.to_numeric(df[column], errors='coerce') if column in df.columns
+                     else pd.Series(float('nan'), index=df.index))
+            for metric, column in self.RATE_METRICS.items()
+        })
+        rates.loc[(templates['suppressed'] == 'Y').to_numpy()] = float('nan')
+        
+        # Row-major: each row's base and bonus records are adjacent
+        metric_count = len(self.RATE_METRICS)
+        positions = pd.RangeIndex(len(df)).repeat(metric_count)
+        metric_names = list(self.RATE_METRICS) * len(df)
+        values = rates.to_numpy(dtype=float).ravel()
         
-        return kpi_df
+        return self._build_kpi_frame(templates, positions, metric_names, values)
     
     def standardize_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """Override to include postsecondary readiness specific missing value handling."""
@@ -512,11 +512,8 @@ def _process_demographic_rows(
     df["year"] = df["school_year"].apply(extract_year_from_school_year).astype(int)
     source_file = f"safe_schools_events_{data_source}"
 
-    student_groups = df.apply(
-        lambda row: demographic_mapper.map_demographic(
-            row["demographic"], row["year"], source_file
-        ),
-        axis=1,
+    student_groups = demographic_mapper.map_demographics_series(
+        df["demographic"], df["year"], source_file
     )
 
     final_df = _process_rows_helper(
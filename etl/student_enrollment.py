@@ -23,7 +23,7 @@ etl_dir = Path(__file__).parent
 sys.path.insert(0, str(etl_dir))
 
 from constants import KPI_COLUMNS
-from base_etl import BaseETL, Config
+from base_etl import BaseETL, Config, RowView
 
 logger = logging.getLogger(__name__)
 
@@ -248,24 +248,27 @@ class StudentEnrollmentETL(BaseETL):
         """
         Override to ensure all student enrollment metrics are created together.
         """
-        kpi_rows = []
+        # Drop rows that shouldn't be processed in one vectorized pass
+        df = df[~self.skip_rows_mask(df)]
+        templates = self.create_kpi_templates(df, source_file) if not df.empty else None
         
-        for _, row in df.iterrows():
-            if self.should_skip_row(row):
-                continue
-            
-            kpi_template = self.create_kpi_template(row, source_file)
-            metrics = self.extract_metrics(row)
+        positions, metric_names, values = [], [], []
+        for position, record in enumerate(df.to_dict('records')):
+            metrics = self.extract_metrics(RowView(record))
             
             # Create separate KPI rows for each metric
             for metric_name, metric_value in metrics.items():
                 if pd.notna(metric_value) and metric_value != 0:  # Skip zero enrollments
-                    kpi_row = kpi_template.copy()
-                    kpi_row['metric'] = metric_name
-                    kpi_row['value'] = metric_value
-                    kpi_rows.append(kpi_row)
+                    positions.append(position)
+                    metric_names.append(metric_name)
+                    values.append(metric_value)
         
-        return pd.DataFrame(kpi_rows, columns=KPI_COLUMNS)
+        if not positions:
+            return pd.DataFrame(columns=KPI_COLUMNS)
+        # Enrollment counts are whole numbers; keep them integers in the published CSV
+        value_dtype = 'Int64' if all(float(value).is_integer() for value in values) else 'Float64'
+        kpi_df = self._build_kpi_frame(templates, positions, metric_names, values, value_dtype=value_dtype)
+        return kpi_df.reindex(columns=KPI_COLUMNS)
     
     def standardize_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """Override to include student enrollment specific missing value handling."""
@@ -169,6 +169,8 @@ def run_etl_module(module_name: str, raw_dir: Path, proc_dir: Path, cfg: dict) -
         # Dynamic import
         spec = importlib.util.spec_from_file_location(module_name, module_path)
         module = importlib.util.module_from_spec(spec)
+        # Register the module so its ETL class can be pickled for worker processes
+        sys.modules[module_name] = module
         spec.loader.exec_module(module)
 
         # Run transform function
@@ -1,3 +1,5 @@
+import importlib.util
+import sys
 import pandas as pd
 import tempfile
 from pathlib import Path
@@ -5,6 +7,7 @@ import logging
 import pytest
 
 from etl.base_etl import BaseETL
+from etl.demographic_mapper import DemographicMapper
 
 
 class DummyETL(BaseETL):
@@ -34,6 +37,18 @@ def test_extract_year():
         result = etl.extract_year(pd.Series(row))
         assert result == expected
 
+    school_years = pd.Series([row["school_year"] for row, _ in data])
+    assert etl.extract_year_series(school_years).tolist() == [expected for _, expected in data]
+
+
+def test_demographic_mapper_loaded_on_first_use():
+    etl = DummyETL("dummy")
+    assert etl._demographic_mapper is None
+
+    mapper = etl.demographic_mapper
+    assert isinstance(mapper, DemographicMapper)
+    assert etl.demographic_mapper is mapper
+
 
 def test_extract_school_id_requires_school_code():
     etl = DummyETL("dummy")
@@ -52,6 +67,21 @@ def test_extract_school_id_requires_school_code():
         etl.extract_school_id(row)
 
 
+def test_clean_school_id_series_matches_scalar():
+    etl = DummyETL("dummy")
+    school_ids = pd.Series(["010203.0", " 040506 ", "", None, "7.05"], dtype=object)
+    expected = [etl._clean_school_id(school_id) for school_id in school_ids]
+    assert etl._clean_school_id_series(school_ids).tolist() == expected
+
+
+def test_normalize_column_names_strips_bom():
+    etl = DummyETL("dummy")
+    df = pd.DataFrame({"\ufeffSchool Code": ["1"], "Other": ["x"]})
+    result = etl.normalize_column_names(df)
+    assert list(result.columns) == ["school_code", "Other"]
+    assert list(df.columns) == ["\ufeffSchool Code", "Other"]
+
+
 def test_validate_demographics_logs(caplog):
     etl = DummyETL("dummy")
     df = pd.DataFrame({"year": ["2024"], "student_group": ["All Students"]})
@@ -87,3 +117,235 @@ def test_save_outputs_creates_files(tmp_path, caplog):
     assert (Path(tmp_path) / "dummy_demographic_report.md").exists()
     assert any("KPI data written" in rec.message for rec in caplog.records)
     assert any("Demographic report written" in rec.message for rec in caplog.records)
+
+
+def test_create_kpi_templates_matches_per_row_template():
+    etl = DummyETL("dummy")
+    df = pd.DataFrame(
+        {
+            "school_code": ["010203.0", " 040506 "],
+            "school_name": ["All Schools", None],
+            "school_year": ["20232024", "bad"],
+            "demographic": ["All Students", "Female"],
+            "suppressed": ["Y", "N"],
+        }
+    )
+    templates = etl.create_kpi_templates(df, "test.csv")
+    for (_, row), (_, template) in zip(df.iterrows(), templates.iterrows()):
+        expected = etl.create_kpi_template(row, "test.csv")
+        for key in ("district", "school_id", "school_name", "year", "student_group", "suppressed", "source_file"):
+            assert template[key] == expected[key]
+
+
+def test_kpi_templates_share_run_timestamp():
+    etl = DummyETL("dummy")
+    df = pd.DataFrame({"school_code": ["010203", "040506"], "demographic": ["All Students", "Female"]})
+    templates = etl.create_kpi_templates(df, "test.csv")
+    row_template = etl.create_kpi_template(df.iloc[0], "test.csv")
+    assert set(templates["last_updated"]) == {row_template["last_updated"]}
+
+
+def test_create_kpi_templates_requires_school_code():
+    etl = DummyETL("dummy")
+    df = pd.DataFrame({"school_code": ["010203", ""], "demographic": ["All Students"] * 2})
+    with pytest.raises(ValueError):
+        etl.create_kpi_templates(df, "test.csv")
+
+
+def test_track_demographics_merges_distinct_pairs():
+    tracker = {"2023": {"Female"}}
+    kpi_df = pd.DataFrame({
+        "year": pd.Categorical(["2023", "2024", "2024", "2024"]),
+        "student_group": pd.Categorical(["Male", "Female", "Female", "All Students"]),
+    })
+
+    BaseETL._track_demographics(kpi_df, tracker)
+
+    assert tracker == {"2023": {"Female", "Male"}, "2024": {"Female", "All Students"}}
+
+
+def test_read_csv_chunks_skips_header_only_file(tmp_path):
+    csv_file = tmp_path / "header_only.csv"
+    csv_file.write_text("School Code,rate\n")
+
+    assert list(DummyETL("dummy")._read_csv_chunks(csv_file)) == []
+
+
+@pytest.mark.parametrize("short_row", ["", "070809,70\n"])
+def test_pyarrow_csv_reader_matches_pandas(tmp_path, short_row):
+    pytest.importorskip("pyarrow")
+    csv_file = tmp_path / "source.csv"
+    csv_file.write_text(
+        "School Code,rate,rate,\n010203,85.5,90,x\n\n040506,,NA,\n111213,None,<NA>,y\n" + short_row
+        + "141516,60,61,z\n"
+    )
+    etl = DummyETL("dummy")
+    etl.STREAM_CHUNK_ROWS = 2
+    expected = pd.concat(etl._read_csv_chunks(csv_file), ignore_index=True)
+
+    etl.USE_PYARROW_CSV = True
+    result = pd.concat(etl._read_csv_chunks(csv_file), ignore_index=True)
+
+    assert list(expected.columns) == ["School Code", "rate", "rate.1", "Unnamed: 3"]
+    assert len(expected) == 4 + bool(short_row)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_skip_rows_mask_matches_should_skip_row():
+    etl = DummyETL("dummy")
+    df = pd.DataFrame({"demographic": ["All Students", None, "District Total", "Female"]})
+    expected = [etl.should_skip_row(row) for _, row in df.iterrows()]
+    assert etl.skip_rows_mask(df).tolist() == expected
+    assert etl.skip_rows_mask(pd.DataFrame({"school_code": ["1"]})).all()
+
+
+class RateETL(DummyETL):
+    METRIC_COLUMNS = {"rate": "dummy_rate"}
+    STREAM_CHUNK_ROWS = 2
+
+
+RATE_SOURCE_ROWS = {
+    "2024": {
+        "School Code": ["010203", "010203", "040506", "040506", "070809"],
+        "School Year": ["20232024"] * 5,
+        "Demographic": ["All Students", "Female", "All Students", "District Total", "Male"],
+        "rate": ["10.5", "*", "30", "40", "50"],
+    },
+    "2023": {
+        "School Code": ["010203", "040506"],
+        "School Year": ["20222023"] * 2,
+        "Demographic": ["All Students", "Male"],
+        "rate": ["11", "12"],
+    },
+}
+
+
+def write_rate_sources(raw_root, years=("2024", "2023")):
+    """Write RateETL source files for the given years under raw_root/dummy."""
+    source_dir = raw_root / "dummy"
+    source_dir.mkdir(parents=True)
+    for year in years:
+        pd.DataFrame(RATE_SOURCE_ROWS[year]).to_csv(source_dir / f"dummy_{year}.csv", index=False)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_process_streaming_rows_matches_process(tmp_path, monkeypatch, max_workers):
+    monkeypatch.setattr(RateETL, "MAX_WORKERS", max_workers)
+    write_rate_sources(tmp_path / "raw")
+
+    outputs = []
+    for name, method in [("batch", "process"), ("stream", "process_streaming_rows")]:
+        proc_dir = tmp_path / name
+        proc_dir.mkdir()
+        getattr(RateETL("dummy"), method)(tmp_path / "raw", proc_dir, {})
+        outputs.append(pd.read_csv(proc_dir / "dummy.csv", dtype=str).drop(columns="last_updated"))
+        assert sorted(p.name for p in proc_dir.iterdir()) == ["dummy.csv", "dummy_demographic_report.md"]
+
+    assert len(outputs[0]) == 5
+    pd.testing.assert_frame_equal(outputs[0], outputs[1])
+
+
+def test_process_output_independent_of_chunk_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(RateETL, "MAX_WORKERS", 1)
+    write_rate_sources(tmp_path / "raw", years=("2024",))
+
+    outputs = []
+    for chunk_rows in [2, 50_000]:
+        monkeypatch.setattr(RateETL, "STREAM_CHUNK_ROWS", chunk_rows)
+        proc_dir = tmp_path / f"chunk_{chunk_rows}"
+        proc_dir.mkdir()
+        RateETL("dummy").process(tmp_path / "raw", proc_dir, {})
+        outputs.append(pd.read_csv(proc_dir / "dummy.csv", dtype=str).drop(columns="last_updated"))
+
+    assert len(outputs[0]) == 3
+    pd.testing.assert_frame_equal(outputs[0], outputs[1])
+
+
+@pytest.mark.parametrize("method", ["process", "process_streaming_rows"])
+def test_parquet_output_matches_csv(tmp_path, monkeypatch, method):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(RateETL, "MAX_WORKERS", 1)
+    write_rate_sources(tmp_path / "raw", years=("2024",))
+    proc_dir = tmp_path / "proc"
+    proc_dir.mkdir()
+
+    getattr(RateETL("dummy"), method)(tmp_path / "raw", proc_dir, {"output_format": "parquet"})
+
+    csv_df = pd.read_csv(proc_dir / "dummy.csv", dtype={"school_id": str, "year": str})
+    parquet_df = pd.read_parquet(proc_dir / "dummy.parquet")
+    assert list(parquet_df.columns) == list(csv_df.columns)
+    assert parquet_df["school_id"].tolist() == ["010203", "040506", "070809"]
+    assert parquet_df["value"].tolist() == csv_df["value"].tolist()
+
+
+RUNNER_STYLE_MODULE = """
+from etl.base_etl import BaseETL
+
+
+class RunnerStyleETL(BaseETL):
+    METRIC_COLUMNS = {"rate": "dummy_rate"}
+    MAX_WORKERS = 2
+
+    @property
+    def module_column_mappings(self):
+        return {}
+
+    def extract_metrics(self, row):
+        return {}
+
+    def get_suppressed_metric_defaults(self, row):
+        return {}
+"""
+
+
+def load_module_like_runner(module_path):
+    """Load a module from its file the way etl_runner did, without registering it."""
+    spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("method", ["process", "process_streaming_rows"])
+def test_unregistered_module_processes_serially(tmp_path, method):
+    module_path = tmp_path / "runner_style_etl.py"
+    module_path.write_text(RUNNER_STYLE_MODULE)
+    module = load_module_like_runner(module_path)
+    assert "runner_style_etl" not in sys.modules
+    write_rate_sources(tmp_path / "raw")
+    proc_dir = tmp_path / "proc"
+    proc_dir.mkdir()
+
+    getattr(module.RunnerStyleETL("dummy"), method)(tmp_path / "raw", proc_dir, {})
+
+    assert len(pd.read_csv(proc_dir / "dummy.csv")) == 5
+
+
+def test_runner_registers_module_for_worker_processes(tmp_path, monkeypatch):
+    import etl_runner
+
+    monkeypatch.syspath_prepend(str(Path(etl_runner.__file__).parent / "etl"))
+    monkeypatch.setattr(importlib.import_module("base_etl").BaseETL, "MAX_WORKERS", 2)
+    # Restored (removed) after the test; the runner registers the module over it
+    monkeypatch.setitem(sys.modules, "kindergarten_readiness", None)
+    source_dir = tmp_path / "raw" / "kindergarten_readiness"
+    source_dir.mkdir(parents=True)
+    for school_year, school_code in [("20222023", "010203"), ("20232024", "040506")]:
+        pd.DataFrame(
+            {
+                "School Year": [school_year],
+                "School Code": [school_code],
+                "Demographic": ["All Students"],
+                "Total Percent Ready": ["55.5"],
+                "Number Tested": ["100"],
+            }
+        ).to_csv(source_dir / f"kindergarten_readiness_{school_year}.csv", index=False)
+    proc_dir = tmp_path / "proc"
+    proc_dir.mkdir()
+
+    etl_runner.run_etl_module("kindergarten_readiness", tmp_path / "raw", proc_dir, {})
+
+    module = sys.modules["kindergarten_readiness"]
+    assert module.KindergartenReadinessETL("kindergarten_readiness")._worker_count(2) == 2
+    kpi_df = pd.read_csv(proc_dir / "kindergarten_readiness.csv", dtype=str)
+    assert sorted(kpi_df["school_id"].unique()) == ["010203", "040506"]
@@ -105,7 +105,44 @@ class TestDemographicMapper:
         ])
         
         pd.testing.assert_series_equal(result, expected)
-    
+
+    def test_series_mapping_by_year_reuses_lookup(self):
+        """Test per-row years and that each label is resolved once per year."""
+        demographics = pd.Series(["Non English Learner", None, "Non English Learner"], index=[5, 5, 7])
+        years = pd.Series(["2024", "2024", "2023"], index=[5, 5, 7])
+
+        result = self.mapper.map_demographics_series(demographics, years, "test")
+        self.mapper.map_demographics_series(demographics, years, "test")
+
+        pd.testing.assert_series_equal(
+            result,
+            pd.Series(["Non-English Learner", "All Students", "Non-English Learner"], index=[5, 5, 7], dtype=object)
+        )
+        assert len(self.mapper.audit_log) == 2
+        assert [entry["count"] for entry in self.mapper.audit_log] == [2, 2]
+
+    def test_lookup_demographic_reuses_lookup(self):
+        """Test single-label lookups resolve and audit each label once."""
+        results = [self.mapper.lookup_demographic("Non English Learner", "2024", "test") for _ in range(3)]
+
+        assert results == ["Non-English Learner"] * 3
+        assert len(self.mapper.audit_log) == 1
+        assert self.mapper.audit_log[0]["count"] == 3
+
+    def test_audit_report_counts_rows(self, tmp_path):
+        """Test report mapping counts are per row and lookups reset between runs."""
+        demographics = pd.Series(["Non English Learner", "Female", "Non English Learner", None])
+        self.mapper.map_demographics_series(demographics, "2024", "test.csv")
+        self.mapper.reset_lookups()
+        self.mapper.map_demographics_series(demographics, "2024", "test.csv")
+
+        assert len(self.mapper.audit_log) == 4
+        report_path = tmp_path / "report.md"
+        self.mapper.save_audit_report(report_path)
+        report = report_path.read_text()
+        assert "- year_specific: 4" in report
+        assert "- standard: 2" in report
+
     def test_validation(self):
         """Test demographic validation functionality."""
         # Test with core demographics present in all years
@@ -297,4 +297,23 @@ class TestGraduationRatesHelpers:
         assert pd.isna(result.loc[0, 'graduation_rate_5_year'])  # '*' in graduation rate column
         assert pd.isna(result.loc[1, 'graduation_rate_5_year'])
         assert result.loc[2, 'graduation_rate_5_year'] == 90.0  # Now numeric after cleaning
-        assert result.loc[3, 'graduation_rate_5_year'] == 0.0
\ No newline at end of file
+        assert result.loc[3, 'graduation_rate_5_year'] == 0.0
+    
+    def test_metrics_frame_matches_per_row_metrics(self, monkeypatch):
+        """Test the vectorized metric path emits the same KPI rows as extract_metrics."""
+        etl = GraduationRatesETL('graduation_rates')
+        df = pd.DataFrame({
+            'school_code': ['1', '2', '3', '4'],
+            'school_year': ['20232024'] * 4,
+            'demographic': ['All Students', 'Female', 'Male', 'All Students'],
+            'suppressed': ['N', 'Y', 'Y', 'N'],
+            'graduation_rate_4_year': [85.5, None, 70.0, None],
+            'grads_4_year_cohort': ['120', None, None, 'bad'],
+            'students_4_year_cohort': ['140', None, None, None],
+        })
+
+        vectorized = etl.convert_to_kpi_format(df, 'test.csv').drop(columns='last_updated')
+        monkeypatch.setattr(etl, 'extract_metrics_frame', lambda frame: None)
+        per_row = etl.convert_to_kpi_format(df, 'test.csv').drop(columns='last_updated')
+
+        pd.testing.assert_frame_equal(vectorized, per_row)
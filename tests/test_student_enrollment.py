@@ -306,6 +306,19 @@ class TestStudentEnrollmentETL:
         assert any('primary_enrollment' in f for f in source_files)
         assert any('secondary_enrollment' in f for f in source_files)
 
+    def test_transform_writes_integer_counts(self):
+        """Test that enrollment counts are written without a decimal part."""
+        data = self.create_sample_historical_primary_data()
+        data.loc[2, 'PRESCHOOL COUNT'] = ''  # A blank cell makes the parsed column float
+        data.to_csv(self.sample_dir / "primary_enrollment_2023.csv", index=False)
+        
+        transform(self.raw_dir, self.proc_dir, {})
+        
+        result_df = pd.read_csv(self.proc_dir / "student_enrollment.csv", dtype=str)
+        totals = result_df[result_df['metric'] == 'student_enrollment_total']['value']
+        assert sorted(totals) == ['250', '250', '500']
+        assert not result_df['value'].str.contains(r'\.').any()
+
     def test_data_type_validation(self):
         """Test that enrollment values are properly validated as numeric."""
         # Test with mixed data types